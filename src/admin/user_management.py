@@ -14,15 +14,12 @@ from pathlib import Path
 
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
-from passlib.context import CryptContext
 from loguru import logger
 
 from ..core.config import UserRole, ROLE_PERMISSIONS
 from ..auth.models import User, UserCreate, UserUpdate
 from ..database.connection import get_db
-
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from ..auth.service import auth_service
 
 class UserManagementService:
     """Service for system administrator user management operations"""
@@ -60,7 +57,7 @@ class UserManagementService:
                 }
             
             # Hash password
-            hashed_password = pwd_context.hash(user_data.password)
+            hashed_password = auth_service.hash_password(user_data.password)
             
             # Create new user
             new_user = User(
@@ -250,7 +247,7 @@ class UserManagementService:
                 }
             
             # Hash new password
-            user.hashed_password = pwd_context.hash(new_password)
+            user.hashed_password = auth_service.hash_password(new_password)
             user.updated_at = datetime.utcnow()
             
             db.commit()
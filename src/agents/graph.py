@@ -7,8 +7,9 @@ Author: Peter Pandey
 Version: 1.0.0
 """
 
-from typing import Dict, List, Any, Optional, TypedDict, Annotated
+from typing import Dict, List, Any, Optional, TypedDict, Annotated, Set, Tuple
 from enum import Enum
+import asyncio
 import json
 from datetime import datetime
 from dataclasses import dataclass
@@ -21,7 +22,7 @@ from langchain_core.prompts import ChatPromptTemplate
 from loguru import logger
 
 from ..core.config import UserRole, settings
-from ..core.euri_client import euri_client, EuriMessage
+from ..core.euri_client import EuriMessage
 from ..core.dual_api_client import dual_api_client
 from ..data.processors import data_processor
 from ..rag.vector_store import vector_store
@@ -481,7 +482,7 @@ class FinSolveAgent:
         
         return state
     
-    def _synthesize_response_node(self, state: AgentState) -> AgentState:
+    async def _synthesize_response_node(self, state: AgentState) -> AgentState:
         """Node to synthesize final response using LLM"""
         try:
             # Prepare context for LLM
@@ -502,8 +503,8 @@ class FinSolveAgent:
                 {"role": "user", "content": user_prompt}
             ]
 
-            # Try dual API client with automatic fallback
-            api_response = dual_api_client.chat_completion(
+            # Hedged Euri/OpenAI request with automatic fallback
+            api_response = await dual_api_client.achat_completion(
                 messages=messages,
                 temperature=0.3,
                 max_tokens=2000,
@@ -1401,6 +1402,16 @@ Remember: This is a conversation, so acknowledge context from previous messages
                 conversation_context=""
             )
     
+    async def process_batch(
+        self,
+        requests: List[Tuple[str, User, str]]
+    ) -> List[Any]:
+        """Process a batch of (query, user, session_id) requests concurrently"""
+        return await asyncio.gather(
+            *[self.process_query(query, user, session_id) for query, user, session_id in requests],
+            return_exceptions=True
+        )
+    
     def _parse_structured_response(self, response_content, query: str) -> Dict[str, str]:
         """Parse response into structured format: short answer, detailed response, and summary"""
         try:
@@ -1571,5 +1582,124 @@ Remember: This is a conversation, so acknowledge context from previous messages
         return min(score, 1.0)
 
 
+# Queue sentinel that tells the batch coordinator to flush and exit
+_BATCHER_STOP = object()
+
+
+class QueryBatcher:
+    """
+    Micro-batching front for agent queries.
+    Collects queries arriving within a short window and dispatches them
+    to the agent as one batch, resolving each caller's future.
+    """
+    
+    def __init__(self, agent: FinSolveAgent, max_batch_size: int = 16, max_wait: float = 0.02):
+        self.agent = agent
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._batches: Set[asyncio.Task] = set()
+    
+    def start(self):
+        """Start the batch coordinator (called from the app lifespan)"""
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+            logger.info("Query batcher started")
+    
+    async def stop(self):
+        """Stop the coordinator, letting queued and in-flight batches finish"""
+        if self._task is None:
+            return
+        
+        # The sentinel lets the coordinator dispatch any partially collected batch
+        self._queue.put_nowait(_BATCHER_STOP)
+        await self._task
+        self._task = None
+        
+        # Queries submitted after the sentinel are still answered
+        pending = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        if pending:
+            self._dispatch(pending)
+        
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+        logger.info("Query batcher stopped")
+    
+    async def submit(self, query: str, user: User, session_id: str) -> ChatbotResponse:
+        """Queue a query for the next batch and wait for its response"""
+        if self._task is None:
+            # Batcher not running (e.g. app started without lifespan) - process directly
+            return await self.agent.process_query(query=query, user=user, session_id=session_id)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((query, user, session_id, future))
+        return await future
+    
+    async def _run(self):
+        """Collect queries for up to max_wait seconds or max_batch_size items"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            item = await self._queue.get()
+            if item is _BATCHER_STOP:
+                return
+            batch = [item]
+            deadline = loop.time() + self.max_wait
+            
+            stopping = False
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is _BATCHER_STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            self._dispatch(batch)
+            if stopping:
+                return
+    
+    def _dispatch(self, batch: List[Tuple[str, User, str, asyncio.Future]]):
+        """Run a batch without blocking collection of the next one"""
+        task = asyncio.create_task(self._process(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+    
+    async def _process(self, batch: List[Tuple[str, User, str, asyncio.Future]]):
+        """Process a batch through the agent and resolve each caller's future"""
+        try:
+            try:
+                results = await self.agent.process_batch(
+                    [(query, user, session_id) for query, user, session_id, _ in batch]
+                )
+            except Exception as e:
+                results = [e] * len(batch)
+            
+            for (_, _, _, future), result in zip(batch, results):
+                if future.done():
+                    continue  # Caller went away
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            # Never leave a caller waiting (short results, cancellation during shutdown)
+            for _, _, _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Query batch was not processed"))
+
+
 # Global agent instance
 finsolve_agent = FinSolveAgent()
+
+# Global query batcher
+query_batcher = QueryBatcher(finsolve_agent)
@@ -10,11 +10,13 @@ Version: 1.0.0
 from fastapi import FastAPI, HTTPException, Depends, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
 import time
 import uuid
+import asyncio
 from typing import Optional
 from loguru import logger
 import sys
@@ -26,10 +28,13 @@ from langchain_core.runnables import RunnableLambda
 from ..core.config import settings
 from ..database.connection import init_database, db_manager
 from ..rag.vector_store import vector_store
-from ..agents.graph import finsolve_agent
+from ..agents.graph import finsolve_agent, query_batcher
 from .routes import auth, chat, admin, health
 from .middleware import LoggingMiddleware, RateLimitMiddleware, SecurityMiddleware
 from .dependencies import get_current_user, get_db
+from ..auth.service import auth_service
+from ..core.dual_api_client import dual_api_client
+from ..core import euri_client as euri_module
 
 
 # Configure logging
@@ -64,6 +69,22 @@ async def lifespan(app: FastAPI):
             logger.info("Indexing data sources...")
             vector_store.index_data_sources()
         
+        # Start the batched chat history writer
+        chat.start_history_writer()
+        
+        # Start the non-blocking system metrics sampler
+        health.start_system_sampler()
+        
+        # Start the agent query micro-batcher
+        query_batcher.start()
+        
+        # Open Euri API connections in the background so the first chat skips the handshake
+        app.state.euri_prewarm = None
+        try:
+            app.state.euri_prewarm = asyncio.create_task(euri_module.euri_client.aprewarm())
+        except euri_module.EuriClientError as e:
+            logger.warning(f"Euri client unavailable, skipping prewarm: {str(e)}")
+        
         logger.info("Application startup completed successfully")
         logger.info("=" * 50)
         logger.info("🚀 FinSolve Technologies AI Assistant API Ready!")
@@ -80,7 +101,19 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down FinSolve RBAC Chatbot API...")
+    if app.state.euri_prewarm is not None:
+        app.state.euri_prewarm.cancel()
+    await query_batcher.stop()
+    await chat.stop_history_writer()
+    await health.stop_system_sampler()
     db_manager.close()
+    await db_manager.close_async()
+    auth_service.shutdown_hash_pool()
+    await dual_api_client.aclose()
+    # Only close the Euri client if something constructed it
+    euri_client = vars(euri_module).get("euri_client")
+    if euri_client is not None:
+        await euri_client.aclose()
     logger.info("Application shutdown completed")
 
 
@@ -92,6 +125,7 @@ app = FastAPI(
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     contact={
         "name": "Dr. Erick K. Yegon",
         "url": "https://finsolve.com",
@@ -120,6 +154,9 @@ app.add_middleware(
     allowed_hosts=["localhost", "127.0.0.1", "*.finsolve.com"]
 )
 
+# Compress larger JSON payloads (chat history, search results)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Custom middleware
 app.add_middleware(LoggingMiddleware)
 app.add_middleware(RateLimitMiddleware)
@@ -19,6 +19,8 @@ from starlette.status import HTTP_429_TOO_MANY_REQUESTS, HTTP_403_FORBIDDEN
 from loguru import logger
 import asyncio
 
+from ..auth.service import set_request_time, reset_request_time
+
 
 class LoggingMiddleware(BaseHTTPMiddleware):
     """
@@ -30,8 +32,9 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         request_id = str(uuid.uuid4())
         request.state.request_id = request_id
         
-        # Start timing
+        # Start timing and pin the auth clock for this request
         start_time = time.time()
+        clock_token = set_request_time()
         
         # Log request
         client_ip = self._get_client_ip(request)
@@ -82,6 +85,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                     "timestamp": time.time()
                 }
             )
+        finally:
+            reset_request_time(clock_token)
     
     def _get_client_ip(self, request: Request) -> str:
         """Extract client IP address"""
@@ -71,7 +71,7 @@ async def create_user(
     Create a new user
     """
     try:
-        new_user = auth_service.create_user(db, user_data)
+        new_user = await auth_service.create_user_async(db, user_data)
         
         logger.info(f"User created by admin: {new_user.username} by {current_user.username}")
         
@@ -81,7 +81,7 @@ async def register_new_employee(
             )
 
         # Create user (initially inactive for approval)
-        new_user = auth_service.create_user(db, user_create)
+        new_user = await auth_service.create_user_async(db, user_create)
         new_user.is_active = False  # Require activation
         db.commit()
 
@@ -151,7 +151,7 @@ async def register_user(
     """
     try:
         # Create user
-        new_user = auth_service.create_user(db, user_data)
+        new_user = await auth_service.create_user_async(db, user_data)
         
         logger.info(f"New user registered: {new_user.username} by admin: {current_user.username}")
         
@@ -180,11 +180,12 @@ async def login(
     Authenticate user and return access token
     """
     try:
-        # Authenticate user
-        user = auth_service.authenticate_user(
+        # Authenticate user; last_login is committed with the new session below
+        user = await auth_service.authenticate_user_async(
             db, 
             user_credentials.username, 
-            user_credentials.password
+            user_credentials.password,
+            commit=False
         )
         
         if not user:
@@ -210,7 +211,7 @@ async def login(
             refresh_token=session_data["refresh_token"],
             token_type="bearer",
             expires_in=session_data["expires_in"],
-            user=UserResponse.from_orm(user)
+            user=UserResponse.from_orm_fast(user)
         )
         
     except HTTPException:
@@ -295,9 +296,8 @@ async def refresh_token(
                 detail="Invalid refresh token"
             )
         
-        # Get user for response
-        session = auth_service.get_active_session(db, session_id)
-        user = session.user if session else None
+        # User was loaded alongside the session during the refresh
+        user = new_tokens["user"]
         
         if not user:
             raise HTTPException(
@@ -312,7 +312,7 @@ async def refresh_token(
             refresh_token=new_tokens["refresh_token"],
             token_type="bearer",
             expires_in=new_tokens["expires_in"],
-            user=UserResponse.from_orm(user)
+            user=UserResponse.from_orm_fast(user)
         )
         
     except HTTPException:
@@ -332,7 +332,7 @@ async def get_current_user_info(
     """
     Get current user information
     """
-    return UserResponse.from_orm(current_user)
+    return UserResponse.from_orm_fast(current_user)
 
 
 @router.put("/me", response_model=UserResponse)
@@ -517,7 +517,7 @@ async def validate_token(
         
         return {
             "valid": True,
-            "user": UserResponse.from_orm(user).dict(),
+            "user": UserResponse.from_orm_fast(user).model_dump(),
             "token_data": {
                 "user_id": token_data.user_id,
                 "username": token_data.username,
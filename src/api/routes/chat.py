@@ -7,19 +7,24 @@ Author: Peter Pandey
 Version: 1.0.0
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import Dict, Any, List, Optional
-import uuid
+from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import aliased
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from types import MappingProxyType
+from typing import Dict, Any, AsyncIterator, List, Mapping, Optional, Tuple
+import asyncio
+from uuid6 import uuid7
 import time
-import json
+import orjson
 from datetime import datetime
 from loguru import logger
 
-from ...database.connection import get_db
+from ...database.connection import get_async_db, db_manager
 from ...auth.models import User, ChatMessage, ChatResponse, ChatHistory
-from ...agents.graph import finsolve_agent
+from ...agents.graph import query_batcher
 from ...data.processors import data_processor
 from ...rag.vector_store import vector_store
 from ...core.config import UserRole
@@ -27,33 +32,28 @@ from ..dependencies import get_current_active_user, get_request_context
 
 router = APIRouter()
 
+# Session titles are the first user message, truncated to this many characters
+SESSION_TITLE_LENGTH = 50
+
+# Rows fetched per round trip when streaming chat history
+HISTORY_STREAM_BATCH_SIZE = 100
+
 
 @router.post("/message", response_model=ChatResponse)
 async def send_message(
     message: ChatMessage,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
     request_context: Dict = Depends(get_request_context)
 ) -> ChatResponse:
     """
     Process a chat message and return AI-generated response
     """
-    start_time = datetime.now()
-    session_id = message.session_id or str(uuid.uuid4())
+    start_time = time.perf_counter()
+    session_id = message.session_id or str(uuid7())
     
     try:
-        # Validate message content
-        if not message.content.strip():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Message content cannot be empty"
-            )
-        
         # Log user message
-        background_tasks.add_task(
-            save_chat_history,
-            db,
+        await save_chat_history(
             current_user.id,
             session_id,
             "user",
@@ -63,7 +63,7 @@ async def send_message(
         
         # Process query through LangGraph agent
         try:
-            response = await finsolve_agent.process_query(
+            response = await query_batcher.submit(
                 query=message.content,
                 user=current_user,
                 session_id=session_id
@@ -101,9 +101,7 @@ async def send_message(
         )
         
         # Log assistant response
-        background_tasks.add_task(
-            save_chat_history,
-            db,
+        await save_chat_history(
             current_user.id,
             session_id,
             "assistant",
@@ -129,7 +127,7 @@ async def send_message(
     except HTTPException:
         raise
     except Exception as e:
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
         
         logger.error(
             f"Chat message processing failed - User: {current_user.username} | "
@@ -138,9 +136,7 @@ async def send_message(
         )
         
         # Log error message
-        background_tasks.add_task(
-            save_chat_history,
-            db,
+        await save_chat_history(
             current_user.id,
             session_id,
             "assistant",
@@ -164,55 +160,32 @@ async def get_chat_history(
     session_id: str,
     limit: int = 50,
     offset: int = 0,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
-) -> Dict[str, Any]:
+    before: Optional[datetime] = None,
+    include_total: bool = False,
+    current_user: User = Depends(get_current_active_user)
+) -> StreamingResponse:
     """
     Get chat history for a specific session
+
+    Pagination probes one extra row to compute ``has_more`` instead of
+    running a separate COUNT(*). Pass the returned ``next_cursor`` as
+    ``before`` for keyset pagination; ``include_total`` adds the total
+    via a window function on the same query. Messages are streamed as
+    they are loaded rather than materialized up front.
     """
     try:
-        # Query chat history
-        history_query = db.query(ChatHistory).filter(
-            ChatHistory.session_id == session_id,
-            ChatHistory.user_id == current_user.id
-        ).order_by(ChatHistory.timestamp.desc())
+        stream = _iter_chat_history_json(
+            session_id, current_user.id, limit, offset, before, include_total
+        )
+        # Pull the first chunk here so query errors surface as a 500
+        head = await stream.__anext__()
         
-        # Apply pagination
-        total_count = history_query.count()
-        history_items = history_query.offset(offset).limit(limit).all()
+        async def body() -> AsyncIterator[bytes]:
+            yield head
+            async for chunk in stream:
+                yield chunk
         
-        # Format response
-        messages = []
-        for item in reversed(history_items):  # Reverse to get chronological order
-            message_data = {
-                "id": item.id,
-                "content": item.content,
-                "message_type": item.message_type,
-                "timestamp": item.timestamp.isoformat(),
-                "metadata": json.loads(item.message_metadata) if item.message_metadata else {}
-            }
-            
-            # Add RAG-specific fields for assistant messages
-            if item.message_type == "assistant":
-                message_data.update({
-                    "retrieved_documents": json.loads(item.retrieved_documents) if item.retrieved_documents else [],
-                    "confidence_score": float(item.confidence_score) if item.confidence_score else None,
-                    "processing_time": float(item.processing_time) if item.processing_time else None
-                })
-            
-            messages.append(message_data)
-        
-        return {
-            "session_id": session_id,
-            "messages": messages,
-            "pagination": {
-                "total": total_count,
-                "limit": limit,
-                "offset": offset,
-                "has_more": offset + limit < total_count
-            },
-            "timestamp": time.time()
-        }
+        return StreamingResponse(body(), media_type="application/json")
         
     except Exception as e:
         logger.error(f"Failed to get chat history: {str(e)}")
@@ -222,42 +195,170 @@ async def get_chat_history(
         )
 
 
+def _format_history_item(item: ChatHistory) -> Dict[str, Any]:
+    """Format a chat history row for the history response"""
+    message_data = {
+        "id": item.id,
+        "content": item.content,
+        "message_type": item.message_type,
+        "timestamp": item.timestamp.isoformat(),
+        "metadata": orjson.loads(item.message_metadata) if item.message_metadata else {}
+    }
+    
+    # Add RAG-specific fields for assistant messages
+    if item.message_type == "assistant":
+        message_data.update({
+            "retrieved_documents": orjson.loads(item.retrieved_documents) if item.retrieved_documents else [],
+            "confidence_score": float(item.confidence_score) if item.confidence_score else None,
+            "processing_time": float(item.processing_time) if item.processing_time else None
+        })
+    
+    return message_data
+
+
+async def _iter_chat_history_json(
+    session_id: str,
+    user_id: int,
+    limit: int,
+    offset: int,
+    before: Optional[datetime],
+    include_total: bool
+) -> AsyncIterator[bytes]:
+    """
+    Stream a page of chat history as a JSON document, oldest message first
+    """
+    async with db_manager.AsyncSessionLocal() as session:
+        # Select the newest limit+1 rows of the page, plus the session total if requested
+        page_columns = [ChatHistory.id.label('id')]
+        if include_total:
+            page_columns.append(func.count().over().label('total'))
+        
+        page_query = select(*page_columns).where(
+            ChatHistory.session_id == session_id,
+            ChatHistory.user_id == user_id
+        )
+        
+        if before is not None:
+            # Keyset pagination - seek past the cursor instead of skipping rows
+            page_query = page_query.where(ChatHistory.timestamp < before)
+        
+        page_query = page_query.order_by(ChatHistory.timestamp.desc())
+        if before is None:
+            page_query = page_query.offset(offset)
+        
+        page = page_query.limit(limit + 1).subquery()
+        
+        # Load the page in chronological order; page_rows tells us up front
+        # whether the first (oldest) row is only the has_more probe
+        columns = [ChatHistory, func.count().over().label('page_rows')]
+        if include_total:
+            columns.append(page.c.total)
+        
+        rows = await session.stream(
+            select(*columns)
+            .join(page, ChatHistory.id == page.c.id)
+            .order_by(ChatHistory.timestamp.asc())
+            .execution_options(yield_per=HISTORY_STREAM_BATCH_SIZE)
+        )
+        
+        yield b'{"session_id":' + orjson.dumps(session_id) + b',"messages":['
+        
+        has_more = False
+        total_count = None
+        oldest_timestamp = None
+        separator = b''
+        index = 0
+        
+        async for row in rows:
+            index += 1
+            if index == 1:
+                has_more = row.page_rows > limit
+                if include_total:
+                    total_count = row.total
+                if has_more:
+                    continue
+            
+            item = row.ChatHistory
+            if oldest_timestamp is None:
+                oldest_timestamp = item.timestamp
+            
+            yield separator + orjson.dumps(_format_history_item(item))
+            separator = b','
+        
+        pagination = {
+            "limit": limit,
+            "offset": offset if before is None else None,
+            "has_more": has_more,
+            "next_cursor": oldest_timestamp.isoformat() if has_more and oldest_timestamp else None
+        }
+        if include_total:
+            pagination["total"] = total_count
+        
+        yield b'],"pagination":' + orjson.dumps(pagination) + b',"timestamp":' + orjson.dumps(time.time()) + b'}'
+
+
 @router.get("/sessions")
 async def get_user_sessions(
+    limit: int = 100,
+    offset: int = 0,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
-    Get all chat sessions for the current user
+    Get chat sessions for the current user, most recent first
     """
     try:
-        # Query distinct sessions
-        sessions_query = db.query(
-            ChatHistory.session_id,
-            func.min(ChatHistory.timestamp).label('first_message'),
-            func.max(ChatHistory.timestamp).label('last_message'),
-            func.count(ChatHistory.id).label('message_count')
-        ).filter(
-            ChatHistory.user_id == current_user.id
-        ).group_by(ChatHistory.session_id).order_by(
-            func.max(ChatHistory.timestamp).desc()
-        )
+        # First user message per session, truncated DB-side to what the title needs
+        first_message = aliased(ChatHistory)
+        title_snippet = select(
+            func.substr(first_message.content, 1, SESSION_TITLE_LENGTH + 1)
+        ).where(
+            first_message.session_id == ChatHistory.session_id,
+            first_message.user_id == current_user.id,
+            first_message.message_type == "user"
+        ).order_by(first_message.timestamp.asc()).limit(1).correlate(ChatHistory).scalar_subquery()
+        
+        async def fetch_sessions(*extra_columns):
+            """Query distinct sessions, probing one extra row for has_more"""
+            result = await db.execute(
+                select(
+                    ChatHistory.session_id,
+                    func.min(ChatHistory.timestamp).label('first_message'),
+                    func.max(ChatHistory.timestamp).label('last_message'),
+                    func.count(ChatHistory.id).label('message_count'),
+                    *extra_columns
+                ).where(
+                    ChatHistory.user_id == current_user.id
+                ).group_by(ChatHistory.session_id).order_by(
+                    func.max(ChatHistory.timestamp).desc()
+                ).offset(offset).limit(limit + 1)
+            )
+            return result.all()
         
-        sessions = sessions_query.all()
+        try:
+            # Sessions together with their titles in one round trip
+            sessions = await fetch_sessions(title_snippet.label('title_snippet'))
+            snippets = [session.title_snippet for session in sessions[:limit]]
+        except SQLAlchemyError as query_error:
+            # Fallback for backends that reject the correlated subquery -
+            # look up the titles concurrently, one session each
+            await db.rollback()
+            logger.warning(f"Session title subquery failed, falling back to per-session lookups: {str(query_error)}")
+            sessions = await fetch_sessions()
+            snippets = await asyncio.gather(*[
+                _first_user_message_snippet(session.session_id, current_user.id)
+                for session in sessions[:limit]
+            ])
+        
+        has_more = len(sessions) > limit
+        sessions = sessions[:limit]
         
         # Format response
         session_list = []
-        for session in sessions:
-            # Get the first user message as session title
-            first_user_message = db.query(ChatHistory).filter(
-                ChatHistory.session_id == session.session_id,
-                ChatHistory.user_id == current_user.id,
-                ChatHistory.message_type == "user"
-            ).order_by(ChatHistory.timestamp.asc()).first()
-            
+        for session, snippet in zip(sessions, snippets):
             title = "New Chat"
-            if first_user_message:
-                title = first_user_message.content[:50] + "..." if len(first_user_message.content) > 50 else first_user_message.content
+            if snippet:
+                title = snippet[:SESSION_TITLE_LENGTH] + "..." if len(snippet) > SESSION_TITLE_LENGTH else snippet
             
             session_list.append({
                 "session_id": session.session_id,
@@ -270,6 +371,11 @@ async def get_user_sessions(
         return {
             "sessions": session_list,
             "total_sessions": len(session_list),
+            "pagination": {
+                "limit": limit,
+                "offset": offset,
+                "has_more": has_more
+            },
             "timestamp": time.time()
         }
         
@@ -281,23 +387,41 @@ async def get_user_sessions(
         )
 
 
+async def _first_user_message_snippet(session_id: str, user_id: int) -> Optional[str]:
+    """Get the start of a session's first user message using a dedicated session"""
+    async with db_manager.AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(
+                func.substr(ChatHistory.content, 1, SESSION_TITLE_LENGTH + 1)
+            ).where(
+                ChatHistory.session_id == session_id,
+                ChatHistory.user_id == user_id,
+                ChatHistory.message_type == "user"
+            ).order_by(ChatHistory.timestamp.asc()).limit(1)
+        )
+        return result.scalar()
+
+
 @router.delete("/sessions/{session_id}")
 async def delete_session(
     session_id: str,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, str]:
     """
     Delete a chat session and all its messages
     """
     try:
-        # Delete all messages in the session
-        deleted_count = db.query(ChatHistory).filter(
-            ChatHistory.session_id == session_id,
-            ChatHistory.user_id == current_user.id
-        ).delete()
+        # Delete all messages in the session with a single DELETE statement
+        result = await db.execute(
+            ChatHistory.__table__.delete().where(
+                ChatHistory.session_id == session_id,
+                ChatHistory.user_id == current_user.id
+            )
+        )
+        deleted_count = result.rowcount
         
-        db.commit()
+        await db.commit()
         
         logger.info(f"Session deleted: {session_id} by {current_user.username} ({deleted_count} messages)")
         
@@ -307,7 +431,7 @@ async def delete_session(
         }
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Failed to delete session: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -369,8 +493,8 @@ async def search_documents(
                 detail="Search query cannot be empty"
             )
         
-        # Search vector store
-        search_results = vector_store.search(
+        # Search vector store (near-duplicate queries are served from the search cache)
+        search_results = vector_store.cached_search(
             query=query,
             user_role=current_user.role,
             n_results=limit,
@@ -406,8 +530,125 @@ async def search_documents(
         )
 
 
-def save_chat_history(
-    db: Session,
+# Write-behind queue for chat history rows
+HISTORY_QUEUE_MAXSIZE = 10000
+HISTORY_BATCH_SIZE = 1000
+HISTORY_FLUSH_INTERVAL = 0.2  # seconds
+
+# Queue sentinel that tells the history writer to flush and exit
+_HISTORY_STOP = object()
+
+_history_queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=HISTORY_QUEUE_MAXSIZE)
+_history_writer_task: Optional[asyncio.Task] = None
+
+
+def _dumps_json(value: Any) -> str:
+    """Serialize a value for a JSON text column"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _build_history_row(
+    user_id: int,
+    session_id: str,
+    message_type: str,
+    content: str,
+    metadata: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build a chat_history row mapping ready for a bulk insert"""
+    return {
+        "session_id": session_id,
+        "user_id": user_id,
+        "message_type": message_type,
+        "content": content,
+        "message_metadata": _dumps_json(metadata) if metadata else None,
+        "retrieved_documents": _dumps_json(metadata.get("sources", [])) if metadata.get("sources") else None,
+        "confidence_score": str(metadata.get("confidence_score")) if metadata.get("confidence_score") is not None else None,
+        "processing_time": str(metadata.get("processing_time")) if metadata.get("processing_time") is not None else None,
+        # Stamp at enqueue time so rows flushed in one batch keep their order
+        "timestamp": datetime.utcnow()
+    }
+
+
+async def _flush_history_batch(rows: List[Dict[str, Any]]):
+    """Insert a batch of rows in a single transaction, logging rather than raising"""
+    try:
+        async with db_manager.async_engine.begin() as conn:
+            for start in range(0, len(rows), HISTORY_BATCH_SIZE):
+                await conn.execute(ChatHistory.__table__.insert(), rows[start:start + HISTORY_BATCH_SIZE])
+    except Exception as e:
+        logger.error(f"Failed to save chat history batch ({len(rows)} rows): {str(e)}")
+
+
+async def _history_flush_loop():
+    """Drain the history queue, flushing every HISTORY_FLUSH_INTERVAL or HISTORY_BATCH_SIZE rows"""
+    loop = asyncio.get_running_loop()
+    rows: List[Dict[str, Any]] = []
+    
+    try:
+        while True:
+            row = await _history_queue.get()
+            if row is _HISTORY_STOP:
+                return
+            rows = [row]
+            deadline = loop.time() + HISTORY_FLUSH_INTERVAL
+            
+            stopping = False
+            while len(rows) < HISTORY_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(_history_queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if row is _HISTORY_STOP:
+                    stopping = True
+                    break
+                rows.append(row)
+            
+            # Shielded so a cancellation cannot abort the transaction midway
+            batch, rows = rows, []
+            await asyncio.shield(_flush_history_batch(batch))
+            if stopping:
+                return
+    except asyncio.CancelledError:
+        # Rows already taken off the queue would otherwise be lost
+        if rows:
+            await asyncio.shield(_flush_history_batch(rows))
+        raise
+
+
+def start_history_writer():
+    """Start the background chat history writer (called from the app lifespan)"""
+    global _history_writer_task
+    
+    if _history_writer_task is None or _history_writer_task.done():
+        _history_writer_task = asyncio.create_task(_history_flush_loop())
+        logger.info("Chat history writer started")
+
+
+async def stop_history_writer():
+    """Stop the chat history writer and flush any queued rows"""
+    global _history_writer_task
+    
+    if _history_writer_task is not None:
+        # The sentinel lets the writer flush the batch it is collecting
+        await _history_queue.put(_HISTORY_STOP)
+        await _history_writer_task
+        _history_writer_task = None
+    
+    # Rows queued after the sentinel
+    rows = []
+    while not _history_queue.empty():
+        rows.append(_history_queue.get_nowait())
+    
+    if rows:
+        await _flush_history_batch(rows)
+    
+    logger.info(f"Chat history writer stopped ({len(rows)} pending rows flushed)")
+
+
+async def save_chat_history(
     user_id: int,
     session_id: str,
     message_type: str,
@@ -415,119 +656,109 @@ def save_chat_history(
     metadata: Dict[str, Any]
 ):
     """
-    Background task to save chat history
+    Queue a chat history row for the background writer
     """
     try:
-        chat_entry = ChatHistory(
-            session_id=session_id,
-            user_id=user_id,
-            message_type=message_type,
-            content=content,
-            message_metadata=json.dumps(metadata) if metadata else None,
-            retrieved_documents=json.dumps(metadata.get("sources", [])) if metadata.get("sources") else None,
-            confidence_score=str(metadata.get("confidence_score")) if metadata.get("confidence_score") is not None else None,
-            processing_time=str(metadata.get("processing_time")) if metadata.get("processing_time") is not None else None
-        )
+        row = _build_history_row(user_id, session_id, message_type, content, metadata)
         
-        db.add(chat_entry)
-        db.commit()
+        if _history_writer_task is None:
+            # Writer not running (e.g. app started without lifespan) - write directly
+            await _flush_history_batch([row])
+        else:
+            await _history_queue.put(row)
         
     except Exception as e:
-        db.rollback()
         logger.error(f"Failed to save chat history: {str(e)}")
 
 
+# Static per-role query suggestions, serialized once at import
+QUERY_SUGGESTIONS: Mapping[UserRole, Tuple[str, ...]] = MappingProxyType({
+    UserRole.EMPLOYEE: (
+        "What is our leave policy?",
+        "How do I submit a reimbursement?",
+        "What are the company holidays?",
+        "Where can I find the employee handbook?",
+        "What are our core values?"
+    ),
+    UserRole.HR: (
+        "Show me employee performance ratings",
+        "What is the average salary in the Technology department?",
+        "How many employees joined this quarter?",
+        "What is our current headcount by department?",
+        "Show me attendance records for this month"
+    ),
+    UserRole.FINANCE: (
+        "What was our Q4 revenue?",
+        "Show me the latest financial report",
+        "What are our major expenses this year?",
+        "How much did we spend on marketing?",
+        "What is our profit margin trend?"
+    ),
+    UserRole.MARKETING: (
+        "What was our customer acquisition cost?",
+        "Show me the latest marketing campaign results",
+        "What is our brand awareness growth?",
+        "How effective were our digital campaigns?",
+        "What is our return on ad spend?"
+    ),
+    UserRole.ENGINEERING: (
+        "What is our system architecture?",
+        "Show me the development processes",
+        "What technologies do we use?",
+        "How do we handle security?",
+        "What is our deployment pipeline?"
+    ),
+    UserRole.CEO: (
+        "Show me quarterly performance trends across all business units",
+        "What are our key operational efficiency metrics?",
+        "Display workforce analytics and organizational health indicators",
+        "Generate executive dashboard with real-time KPIs",
+        "Give me a comprehensive company overview"
+    ),
+    UserRole.CFO: (
+        "Analyze revenue growth and margin trends by quarter",
+        "What is our current budget utilization across departments?",
+        "Show customer acquisition cost and lifetime value analysis",
+        "Generate financial executive summary for board presentation",
+        "What are our major financial risks and opportunities?"
+    ),
+    UserRole.CTO: (
+        "Explain our system architecture and security framework",
+        "What are our current system performance metrics?",
+        "Show technical debt analysis and optimization opportunities",
+        "Display infrastructure utilization and scaling metrics",
+        "What are our technology roadmap priorities?"
+    ),
+    UserRole.CHRO: (
+        "Display workforce analytics and organizational health indicators",
+        "What are our employee engagement and retention metrics?",
+        "Show performance management and development trends",
+        "Analyze compensation and benefits effectiveness",
+        "What are our diversity and inclusion progress metrics?"
+    ),
+    UserRole.VP_MARKETING: (
+        "Show marketing campaign performance and ROI analysis",
+        "What are our customer acquisition and conversion metrics?",
+        "Display brand awareness and market share trends",
+        "Analyze digital marketing effectiveness across channels",
+        "What are our competitive positioning insights?"
+    )
+})
+
+_SUGGESTIONS_CACHE: Mapping[UserRole, bytes] = MappingProxyType({
+    role: orjson.dumps({
+        "suggestions": QUERY_SUGGESTIONS.get(role, QUERY_SUGGESTIONS[UserRole.EMPLOYEE]),
+        "user_role": role.value
+    })
+    for role in UserRole
+})
+
+
 @router.get("/suggestions")
 async def get_query_suggestions(
     current_user: User = Depends(get_current_active_user)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get query suggestions based on user role
     """
-    suggestions = {
-        UserRole.EMPLOYEE: [
-            "What is our leave policy?",
-            "How do I submit a reimbursement?",
-            "What are the company holidays?",
-            "Where can I find the employee handbook?",
-            "What are our core values?"
-        ],
-        UserRole.HR: [
-            "Show me employee performance ratings",
-            "What is the average salary in the Technology department?",
-            "How many employees joined this quarter?",
-            "What is our current headcount by department?",
-            "Show me attendance records for this month"
-        ],
-        UserRole.FINANCE: [
-            "What was our Q4 revenue?",
-            "Show me the latest financial report",
-            "What are our major expenses this year?",
-            "How much did we spend on marketing?",
-            "What is our profit margin trend?"
-        ],
-        UserRole.MARKETING: [
-            "What was our customer acquisition cost?",
-            "Show me the latest marketing campaign results",
-            "What is our brand awareness growth?",
-            "How effective were our digital campaigns?",
-            "What is our return on ad spend?"
-        ],
-        UserRole.ENGINEERING: [
-            "What is our system architecture?",
-            "Show me the development processes",
-            "What technologies do we use?",
-            "How do we handle security?",
-            "What is our deployment pipeline?"
-        ],
-        UserRole.CEO: [
-            "Show me quarterly performance trends across all business units",
-            "What are our key operational efficiency metrics?",
-            "Display workforce analytics and organizational health indicators",
-            "Generate executive dashboard with real-time KPIs",
-            "Give me a comprehensive company overview"
-        ],
-        UserRole.CFO: [
-            "Analyze revenue growth and margin trends by quarter",
-            "What is our current budget utilization across departments?",
-            "Show customer acquisition cost and lifetime value analysis",
-            "Generate financial executive summary for board presentation",
-            "What are our major financial risks and opportunities?"
-        ],
-        UserRole.CTO: [
-            "Explain our system architecture and security framework",
-            "What are our current system performance metrics?",
-            "Show technical debt analysis and optimization opportunities",
-            "Display infrastructure utilization and scaling metrics",
-            "What are our technology roadmap priorities?"
-        ],
-        UserRole.CHRO: [
-            "Display workforce analytics and organizational health indicators",
-            "What are our employee engagement and retention metrics?",
-            "Show performance management and development trends",
-            "Analyze compensation and benefits effectiveness",
-            "What are our diversity and inclusion progress metrics?"
-        ],
-        UserRole.VP_MARKETING: [
-            "Show marketing campaign performance and ROI analysis",
-            "What are our customer acquisition and conversion metrics?",
-            "Display brand awareness and market share trends",
-            "Analyze digital marketing effectiveness across channels",
-            "What are our competitive positioning insights?"
-        ]
-    }
-    
-    # Get suggestions for user role, with fallback to CEO for executive roles not found
-    user_suggestions = suggestions.get(current_user.role)
-    if not user_suggestions:
-        # Fallback for executive roles
-        if current_user.role in [UserRole.CEO, UserRole.CFO, UserRole.CTO, UserRole.CHRO, UserRole.VP_MARKETING]:
-            user_suggestions = suggestions[UserRole.CEO]
-        else:
-            user_suggestions = suggestions[UserRole.EMPLOYEE]
-    
-    return {
-        "suggestions": user_suggestions,
-        "user_role": current_user.role.value,
-        "timestamp": time.time()
-    }
+    return Response(content=_SUGGESTIONS_CACHE[current_user.role], media_type="application/json")
@@ -8,11 +8,13 @@ Version: 1.0.0
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import asyncio
 import time
 import psutil
 import os
 from datetime import datetime
+from loguru import logger
 
 from ...database.connection import get_db, db_manager
 from ...rag.vector_store import vector_store
@@ -21,6 +23,83 @@ from ..middleware import metrics_middleware
 
 router = APIRouter()
 
+# System metrics sampling - cpu_percent(interval=None) measures since the
+# previous call, so a background sampler keeps probes from blocking for 1s
+SYSTEM_SAMPLE_INTERVAL = 5.0  # seconds between background CPU samples
+SYSTEM_SNAPSHOT_TTL = 1.0  # seconds a memory/disk reading is reused
+
+_process = psutil.Process()
+_system_snapshot: Dict[str, Any] = {
+    "cpu_percent": 0.0,
+    "cpu_sampled_at": 0.0,
+    "memory": None,
+    "disk": None,
+    "load_average": "N/A",
+    "sampled_at": 0.0
+}
+_system_sampler_task: Optional[asyncio.Task] = None
+
+# Prime the CPU counters so the first non-blocking read is meaningful
+psutil.cpu_percent(interval=None)
+_process.cpu_percent(interval=None)
+
+
+def _sample_system_metrics(include_cpu: bool = True):
+    """Refresh the cached system snapshot without blocking"""
+    now = time.monotonic()
+    
+    if include_cpu:
+        _system_snapshot["cpu_percent"] = psutil.cpu_percent(interval=None)
+        _system_snapshot["cpu_sampled_at"] = now
+    
+    _system_snapshot["memory"] = psutil.virtual_memory()
+    _system_snapshot["disk"] = psutil.disk_usage('/')
+    _system_snapshot["load_average"] = os.getloadavg() if hasattr(os, 'getloadavg') else "N/A"
+    _system_snapshot["sampled_at"] = now
+
+
+def get_system_snapshot() -> Dict[str, Any]:
+    """Get cached system metrics, refreshing readings older than the TTL"""
+    now = time.monotonic()
+    
+    if now - _system_snapshot["sampled_at"] > SYSTEM_SNAPSHOT_TTL:
+        # Only take a CPU reading here if the background sampler is not keeping it fresh
+        cpu_stale = now - _system_snapshot["cpu_sampled_at"] > SYSTEM_SAMPLE_INTERVAL
+        _sample_system_metrics(include_cpu=cpu_stale)
+    
+    return _system_snapshot
+
+
+async def _system_sampler_loop():
+    """Sample CPU utilisation every SYSTEM_SAMPLE_INTERVAL seconds"""
+    while True:
+        try:
+            _sample_system_metrics()
+        except Exception as e:
+            logger.warning(f"System metrics sampling failed: {str(e)}")
+        await asyncio.sleep(SYSTEM_SAMPLE_INTERVAL)
+
+
+def start_system_sampler():
+    """Start the background system metrics sampler (called from the app lifespan)"""
+    global _system_sampler_task
+    
+    if _system_sampler_task is None or _system_sampler_task.done():
+        _system_sampler_task = asyncio.create_task(_system_sampler_loop())
+
+
+async def stop_system_sampler():
+    """Stop the background system metrics sampler"""
+    global _system_sampler_task
+    
+    if _system_sampler_task is not None:
+        _system_sampler_task.cancel()
+        try:
+            await _system_sampler_task
+        except asyncio.CancelledError:
+            pass
+        _system_sampler_task = None
+
 
 @router.get("/")
 async def health_check() -> Dict[str, Any]:
@@ -54,49 +133,77 @@ async def detailed_health_check(db: Session = Depends(get_db)) -> Dict[str, Any]
         "uptime": time.time()  # Will be calculated properly in production
     }
     
-    # Check database health
-    try:
-        db_healthy = db_manager.health_check()
-        health_status["dependencies"]["database"] = {
-            "status": "healthy" if db_healthy else "unhealthy",
-            "connection_info": db_manager.get_connection_info(),
-            "response_time": "< 100ms"  # Placeholder
-        }
-    except Exception as e:
+    db_result, vector_result, system_result = await asyncio.gather(
+        _check_database(),
+        _check_vector_store(),
+        _check_system(),
+        return_exceptions=True
+    )
+    
+    # Database health
+    if isinstance(db_result, Exception):
         health_status["dependencies"]["database"] = {
             "status": "unhealthy",
-            "error": str(e)
+            "error": str(db_result)
         }
         health_status["status"] = "degraded"
+    else:
+        health_status["dependencies"]["database"] = db_result
     
-    # Check vector store health
-    try:
-        vector_stats = vector_store.get_collection_stats()
-        health_status["dependencies"]["vector_store"] = {
-            "status": "healthy" if vector_stats else "unhealthy",
-            "stats": vector_stats
-        }
-    except Exception as e:
+    # Vector store health
+    if isinstance(vector_result, Exception):
         health_status["dependencies"]["vector_store"] = {
             "status": "unhealthy",
-            "error": str(e)
+            "error": str(vector_result)
         }
         health_status["status"] = "degraded"
+    else:
+        health_status["dependencies"]["vector_store"] = vector_result
     
     # System metrics
-    try:
-        health_status["system"] = {
-            "cpu_percent": psutil.cpu_percent(interval=1),
-            "memory_percent": psutil.virtual_memory().percent,
-            "disk_percent": psutil.disk_usage('/').percent,
-            "load_average": os.getloadavg() if hasattr(os, 'getloadavg') else "N/A"
-        }
-    except Exception as e:
-        health_status["system"] = {"error": str(e)}
+    if isinstance(system_result, Exception):
+        health_status["system"] = {"error": str(system_result)}
+    else:
+        health_status["system"] = system_result
     
     return health_status
 
 
+async def _check_database() -> Dict[str, Any]:
+    """Database health and connection info, run off the event loop"""
+    def check():
+        start_time = time.perf_counter()
+        db_healthy = db_manager.health_check()
+        connection_info = db_manager.get_connection_info()
+        return {
+            "status": "healthy" if db_healthy else "unhealthy",
+            "connection_info": connection_info,
+            "response_time": f"{time.perf_counter() - start_time:.3f}s"
+        }
+    
+    return await asyncio.to_thread(check)
+
+
+async def _check_vector_store() -> Dict[str, Any]:
+    """Vector store health, run off the event loop"""
+    vector_stats = await asyncio.to_thread(vector_store.get_collection_stats)
+    return {
+        "status": "healthy" if vector_stats else "unhealthy",
+        "stats": vector_stats
+    }
+
+
+async def _check_system() -> Dict[str, Any]:
+    """System metrics from the cached snapshot"""
+    snapshot = await asyncio.to_thread(get_system_snapshot)
+    return {
+        "cpu_percent": snapshot["cpu_percent"],
+        "memory_percent": snapshot["memory"].percent,
+        "disk_percent": snapshot["disk"].percent,
+        "load_average": snapshot["load_average"]
+    }
+
+
 @router.get("/metrics")
 async def get_metrics() -> Dict[str, Any]:
     """
@@ -176,15 +283,17 @@ async def system_health() -> Dict[str, Any]:
     System resource health check
     """
     try:
+        snapshot = get_system_snapshot()
+        
         # CPU information
         cpu_info = {
-            "percent": psutil.cpu_percent(interval=1),
+            "percent": snapshot["cpu_percent"],
             "count": psutil.cpu_count(),
             "count_logical": psutil.cpu_count(logical=True)
         }
         
         # Memory information
-        memory = psutil.virtual_memory()
+        memory = snapshot["memory"]
         memory_info = {
             "total": memory.total,
             "available": memory.available,
@@ -194,7 +303,7 @@ async def system_health() -> Dict[str, Any]:
         }
         
         # Disk information
-        disk = psutil.disk_usage('/')
+        disk = snapshot["disk"]
         disk_info = {
             "total": disk.total,
             "used": disk.used,
@@ -212,13 +321,12 @@ async def system_health() -> Dict[str, Any]:
         }
         
         # Process information
-        process = psutil.Process()
         process_info = {
-            "pid": process.pid,
-            "memory_percent": process.memory_percent(),
-            "cpu_percent": process.cpu_percent(),
-            "num_threads": process.num_threads(),
-            "create_time": process.create_time()
+            "pid": _process.pid,
+            "memory_percent": _process.memory_percent(),
+            "cpu_percent": _process.cpu_percent(interval=None),
+            "num_threads": _process.num_threads(),
+            "create_time": _process.create_time()
         }
         
         return {
@@ -250,18 +358,19 @@ async def readiness_check(db: Session = Depends(get_db)) -> Dict[str, Any]:
         "vector_store": False
     }
     
+    db_healthy, vector_stats = await asyncio.gather(
+        asyncio.to_thread(db_manager.health_check),
+        asyncio.to_thread(vector_store.get_collection_stats),
+        return_exceptions=True
+    )
+    
     # Check database
-    try:
-        checks["database"] = db_manager.health_check()
-    except Exception:
-        pass
+    if not isinstance(db_healthy, Exception):
+        checks["database"] = bool(db_healthy)
     
     # Check vector store
-    try:
-        stats = vector_store.get_collection_stats()
-        checks["vector_store"] = bool(stats)
-    except Exception:
-        pass
+    if not isinstance(vector_stats, Exception):
+        checks["vector_store"] = bool(vector_stats)
     
     all_healthy = all(checks.values())
     
@@ -8,18 +8,77 @@ Version: 1.0.0
 
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, SmallInteger, String, DateTime, Boolean, Text, LargeBinary, ForeignKey, Index, text
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from pydantic import BaseModel, EmailStr, field_validator
 from enum import Enum
-import uuid
+from uuid6 import uuid7
+import re
+import string
 
 from ..core.config import UserRole
 
 Base = declarative_base()
 
+# Registration validation tables, built once at import
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9._-]+\Z')
+_REGISTRATION_DEPARTMENTS = (
+    "Engineering", "Finance", "HR", "Marketing", "Sales",
+    "Customer Support", "IT Security", "Data Analytics",
+    "R&D", "QA", "Operations", "Legal", "Executive"
+)
+_REGISTRATION_DEPARTMENT_SET = frozenset(_REGISTRATION_DEPARTMENTS)
+_REGISTRATION_ROLES = ("Employee", "Manager", "Director", "C-Level Executive")
+_REGISTRATION_ROLE_SET = frozenset(_REGISTRATION_ROLES)
+_ASCII_UPPER = frozenset(string.ascii_uppercase)
+_ASCII_LOWER = frozenset(string.ascii_lowercase)
+_ASCII_DIGITS = frozenset(string.digits)
+
+
+def _has_char_class(v: str, ascii_chars: frozenset, predicate) -> bool:
+    """Check for a character class, using a C-level set probe before the per-char scan"""
+    return not ascii_chars.isdisjoint(v) or (not v.isascii() and any(predicate(c) for c in v))
+
+# Stable storage codes for roles. Append new roles with new codes; never
+# renumber, as the codes are persisted in users.role.
+_ROLE_CODES = {
+    UserRole.EMPLOYEE: 0,
+    UserRole.HR: 1,
+    UserRole.FINANCE: 2,
+    UserRole.MARKETING: 3,
+    UserRole.ENGINEERING: 4,
+    UserRole.CEO: 5,
+    UserRole.CFO: 6,
+    UserRole.CTO: 7,
+    UserRole.CHRO: 8,
+    UserRole.VP_MARKETING: 9,
+    UserRole.SYSTEM_ADMIN: 10,
+}
+_ROLES_BY_CODE = {code: role for role, code in _ROLE_CODES.items()}
+
+
+class RoleType(TypeDecorator):
+    """Store UserRole as a SMALLINT code while exposing the string enum in Python"""
+    impl = SmallInteger
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return _ROLE_CODES[UserRole(value)]
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            # SQLite text-affinity columns return codes as digit strings;
+            # anything else is a row not yet migrated from enum-name storage
+            return _ROLES_BY_CODE[int(value)] if value.isdigit() else UserRole[value]
+        return _ROLES_BY_CODE[value]
+
 
 class User(Base):
     """
@@ -28,12 +87,12 @@ class User(Base):
     __tablename__ = "users"
     
     id = Column(Integer, primary_key=True, index=True)
-    uuid = Column(String(36), unique=True, index=True, default=lambda: str(uuid.uuid4()))
+    uuid = Column(String(36), unique=True, index=True, default=lambda: str(uuid7()))  # time-ordered for index locality
     email = Column(String(255), unique=True, index=True, nullable=False)
     username = Column(String(100), unique=True, index=True, nullable=False)
     full_name = Column(String(255), nullable=False)
     hashed_password = Column(String(255), nullable=False)
-    role = Column(SQLEnum(UserRole), nullable=False, default=UserRole.EMPLOYEE)
+    role = Column(RoleType(), nullable=False, default=UserRole.EMPLOYEE)
     department = Column(String(100), nullable=True)
     employee_id = Column(String(50), unique=True, index=True, nullable=True)
     
@@ -61,8 +120,10 @@ class UserSession(Base):
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(String(255), unique=True, index=True, nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    access_token = Column(Text, nullable=False)
+    access_token = Column(Text, nullable=True)  # Legacy full JWT; no longer written
+    access_token_hash = Column(LargeBinary(16), index=True, nullable=True)  # BLAKE2b-128 of the JWT
     refresh_token = Column(Text, nullable=True)
+    refresh_token_hash = Column(LargeBinary(16), index=True, nullable=True)  # BLAKE2b-128, lookup key
     expires_at = Column(DateTime, nullable=False)
     created_at = Column(DateTime, default=func.now())
     last_accessed = Column(DateTime, default=func.now())
@@ -73,6 +134,17 @@ class UserSession(Base):
     # Relationships
     user = relationship("User", back_populates="sessions")
     
+    # Indexes for active-session validation, per-user invalidation and expiry cleanup
+    __table_args__ = (
+        Index(
+            'ix_sessions_active', 'session_id', 'is_active', 'expires_at',
+            postgresql_where=text('is_active = true'),
+            sqlite_where=text('is_active = 1')
+        ),
+        Index('ix_sessions_user_active', 'user_id', 'is_active'),
+        Index('ix_sessions_expires_at', 'expires_at'),
+    )
+    
     def __repr__(self):
         return f"<UserSession(user_id={self.user_id}, expires_at='{self.expires_at}')>"
 
@@ -99,6 +171,12 @@ class ChatHistory(Base):
     # Relationships
     user = relationship("User", back_populates="chat_history")
     
+    # Indexes for history pagination, session listing and session deletion
+    __table_args__ = (
+        Index('ix_chat_user_session_ts', 'user_id', 'session_id', 'timestamp'),
+        Index('ix_chat_user_ts', 'user_id', 'timestamp'),
+    )
+    
     def __repr__(self):
         return f"<ChatHistory(user_id={self.user_id}, type='{self.message_type}', timestamp='{self.timestamp}')>"
 
@@ -124,21 +202,20 @@ class UserCreate(UserBase):
     def validate_password(cls, v):
         if len(v) < 8:
             raise ValueError('Password must be at least 8 characters long')
-        if not any(c.isupper() for c in v):
+        if not _has_char_class(v, _ASCII_UPPER, str.isupper):
             raise ValueError('Password must contain at least one uppercase letter')
-        if not any(c.islower() for c in v):
+        if not _has_char_class(v, _ASCII_LOWER, str.islower):
             raise ValueError('Password must contain at least one lowercase letter')
-        if not any(c.isdigit() for c in v):
+        if not _has_char_class(v, _ASCII_DIGITS, str.isdigit):
             raise ValueError('Password must contain at least one digit')
         return v
 
     @field_validator('username')
     @classmethod
     def validate_username(cls, v):
-        import re
         if len(v) < 3:
             raise ValueError('Username must be at least 3 characters long')
-        if not re.match(r'^[a-zA-Z0-9._-]+$', v):
+        if not _USERNAME_RE.match(v):
             raise ValueError('Username must contain only alphanumeric characters, dots, underscores, or hyphens')
         return v
 
@@ -166,21 +243,15 @@ class UserRegistration(BaseModel):
     @field_validator('department')
     @classmethod
     def validate_department(cls, v):
-        valid_departments = [
-            "Engineering", "Finance", "HR", "Marketing", "Sales",
-            "Customer Support", "IT Security", "Data Analytics",
-            "R&D", "QA", "Operations", "Legal", "Executive"
-        ]
-        if v not in valid_departments:
-            raise ValueError(f'Department must be one of: {", ".join(valid_departments)}')
+        if v not in _REGISTRATION_DEPARTMENT_SET:
+            raise ValueError(f'Department must be one of: {", ".join(_REGISTRATION_DEPARTMENTS)}')
         return v
 
     @field_validator('role')
     @classmethod
     def validate_role(cls, v):
-        valid_roles = ["Employee", "Manager", "Director", "C-Level Executive"]
-        if v not in valid_roles:
-            raise ValueError(f'Role must be one of: {", ".join(valid_roles)}')
+        if v not in _REGISTRATION_ROLE_SET:
+            raise ValueError(f'Role must be one of: {", ".join(_REGISTRATION_ROLES)}')
         return v
 
     @field_validator('access_reason')
@@ -219,6 +290,15 @@ class UserResponse(UserBase):
     
     class Config:
         from_attributes = True
+    
+    @classmethod
+    def from_orm_fast(cls, user: "User") -> "UserResponse":
+        """Build from a trusted ORM user without re-validating its fields"""
+        state = user.__dict__
+        return cls.model_construct(**{
+            name: state[name] if name in state else getattr(user, name)
+            for name in cls.model_fields
+        })
 
 
 class UserLogin(BaseModel):
@@ -250,6 +330,13 @@ class ChatMessage(BaseModel):
     message_type: str = "user"
     session_id: Optional[str] = None
 
+    @field_validator('content')
+    @classmethod
+    def validate_content(cls, v):
+        if not v or not v.strip():
+            raise ValueError('Message content cannot be empty')
+        return v
+
 
 class ChatResponse(BaseModel):
     """Enhanced chat response model with structured content"""
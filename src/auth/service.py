@@ -7,20 +7,106 @@ Version: 1.0.0
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from contextvars import ContextVar, Token as ContextToken
+from typing import Optional, Dict, Any, List, Tuple
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, delete, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from passlib.context import CryptContext
 from jose import JWTError, jwt
-import uuid
+from jose.backends import HMACKey
+from cachetools import TLRUCache, TTLCache
+from uuid6 import uuid7
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import csv
+import io
+import os
+import hmac
+import hashlib
 import secrets
+import threading
+import time
 from loguru import logger
 
-from .models import User, UserSession, UserCreate, UserLogin, TokenData
+from .models import User, UserSession, ChatHistory, UserCreate, UserLogin, TokenData
 from ..core.config import settings, UserRole, ROLE_PERMISSIONS
 from ..database.connection import get_db
 
 
+# Rows per bulk_insert_mappings call when saving chat history
+CHAT_HISTORY_INSERT_BATCH_SIZE = 1000
+
+# Rows per DELETE transaction when purging expired sessions
+SESSION_CLEANUP_BATCH_SIZE = 5000
+
+# Rows per bulk_insert_mappings call when bulk-creating sessions
+SESSION_INSERT_BATCH_SIZE = 1000
+
+
+# Request-scoped clock. The API sets it once per request so every timestamp
+# the auth service derives while handling that request agrees.
+_request_now: ContextVar[Optional[datetime]] = ContextVar("auth_request_now", default=None)
+
+
+def set_request_time(now: Optional[datetime] = None) -> ContextToken:
+    """Pin the auth service clock for the current request"""
+    return _request_now.set(now or datetime.utcnow())
+
+
+def reset_request_time(token: ContextToken):
+    """Release the clock pinned by set_request_time"""
+    _request_now.reset(token)
+
+
+def _token_digest(token: str) -> bytes:
+    """BLAKE2b-128 digest of a token, used for cache keys and stored token hashes"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _build_pwd_context() -> CryptContext:
+    """Build the password hashing context"""
+    # Argon2id for new hashes. Legacy bcrypt hashes still verify and are
+    # upgraded on the next successful login: "$bcrypt-sha256$v=2" rows use
+    # the SHA-256 prehash (no 72-byte truncation), plain "$2b$" rows the
+    # original path.
+    return CryptContext(
+        schemes=["argon2", "bcrypt_sha256", "bcrypt"],
+        deprecated="auto",
+        argon2__type="ID",
+        argon2__time_cost=settings.argon2_time_cost,
+        argon2__memory_cost=settings.argon2_memory_cost,
+        argon2__parallelism=settings.argon2_parallelism,
+        bcrypt_sha256__rounds=settings.bcrypt_rounds,
+        bcrypt__rounds=settings.bcrypt_rounds
+    )
+
+
+# Per-process context used inside hash pool workers, so the CryptContext
+# itself never has to be pickled across the process boundary
+_worker_pwd_context: Optional[CryptContext] = None
+
+
+def _get_worker_pwd_context() -> CryptContext:
+    """Get (or lazily build) the hash pool worker's password context"""
+    global _worker_pwd_context
+    if _worker_pwd_context is None:
+        _worker_pwd_context = _build_pwd_context()
+    return _worker_pwd_context
+
+
+def _hash_in_worker(password: str) -> str:
+    """Hash a password inside a hash pool worker"""
+    return _get_worker_pwd_context().hash(password)
+
+
+def _verify_and_update_in_worker(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify a password inside a hash pool worker"""
+    return _get_worker_pwd_context().verify_and_update(plain_password, hashed_password)
+
+
 class AuthenticationError(Exception):
     """Custom exception for authentication errors"""
     pass
@@ -42,24 +128,140 @@ class AuthService:
     """
     
     def __init__(self):
-        self.pwd_context = CryptContext(
-            schemes=["bcrypt"],
-            deprecated="auto",
-            bcrypt__rounds=settings.bcrypt_rounds
-        )
+        self.pwd_context = _build_pwd_context()
         self.secret_key = settings.secret_key
         self.algorithm = settings.algorithm
         self.access_token_expire_minutes = settings.access_token_expire_minutes
         
+        # HS256 signing should run through OpenSSL (SHA-NI where available)
+        # via the cryptography backend rather than jose's pure-Python fallback
+        if HMACKey.__module__ != "jose.backends.cryptography_backend":
+            logger.warning(
+                "python-jose is not using the cryptography backend for HMAC; "
+                "install python-jose[cryptography] for accelerated token signing"
+            )
+        
+        # Recent password verification results. Keys embed the stored hash, so
+        # a password change invalidates them; failures expire much sooner.
+        self._verify_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+        self._verify_failure_cache: TTLCache = TTLCache(maxsize=10_000, ttl=5)
+        self._verify_lock = threading.Lock()
+        self._verify_pepper = self.secret_key.encode()
+        
+        # Decoded JWTs keyed by token digest; each entry lives until its
+        # token's own expiry. Values are (monotonic expiry, TokenData).
+        self._token_cache: TLRUCache = TLRUCache(
+            maxsize=10_000,
+            ttu=lambda _key, value, _now: value[0]
+        )
+        self._token_lock = threading.Lock()
+        
+        # KDF work is CPU-bound; async callers offload it to a process pool
+        # (created on first use) so it runs off the event loop on all cores
+        self._hash_pool: Optional[ProcessPoolExecutor] = None
+        self._hash_pool_lock = threading.Lock()
+        
         logger.info("Authentication service initialized")
     
+    def _now(self) -> datetime:
+        """Current UTC time, pinned per request when the API has set it"""
+        return _request_now.get() or datetime.utcnow()
+    
     def hash_password(self, password: str) -> str:
-        """Hash a password using bcrypt"""
+        """Hash a password using Argon2id"""
         return self.pwd_context.hash(password)
     
+    def _verify_cache_key(self, plain_password: str, hashed_password: str) -> Tuple[bytes, str]:
+        """Build a verification cache key without retaining the plaintext"""
+        digest = hmac.new(self._verify_pepper, plain_password.encode(), hashlib.sha256).digest()
+        return digest, hashed_password
+    
+    def _cached_verification(self, key: Tuple[bytes, str]) -> Optional[bool]:
+        """Return a cached verification result, if any"""
+        with self._verify_lock:
+            if key in self._verify_cache:
+                return True
+            if key in self._verify_failure_cache:
+                return False
+        return None
+    
+    def _store_verification(self, key: Tuple[bytes, str], verified: bool):
+        """Remember a verification result"""
+        with self._verify_lock:
+            if verified:
+                self._verify_cache[key] = True
+            else:
+                self._verify_failure_cache[key] = False
+    
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash"""
-        return self.pwd_context.verify(plain_password, hashed_password)
+        key = self._verify_cache_key(plain_password, hashed_password)
+        cached = self._cached_verification(key)
+        if cached is not None:
+            return cached
+        
+        verified = self.pwd_context.verify(plain_password, hashed_password)
+        self._store_verification(key, verified)
+        return verified
+    
+    def verify_and_update_password(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verify a password and return a replacement hash if it uses a deprecated scheme"""
+        key = self._verify_cache_key(plain_password, hashed_password)
+        cached = self._cached_verification(key)
+        if cached is not None and not (cached and self.pwd_context.needs_update(hashed_password)):
+            return cached, None
+        
+        verified, new_hash = self.pwd_context.verify_and_update(plain_password, hashed_password)
+        self._store_verification(key, verified)
+        return verified, new_hash
+    
+    def _get_hash_pool(self) -> ProcessPoolExecutor:
+        """Get (or lazily create) the password hashing process pool"""
+        with self._hash_pool_lock:
+            if self._hash_pool is None:
+                self._hash_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+                logger.info(f"Password hashing pool started ({os.cpu_count()} workers)")
+            return self._hash_pool
+    
+    def shutdown_hash_pool(self):
+        """Shut down the password hashing process pool"""
+        with self._hash_pool_lock:
+            if self._hash_pool is not None:
+                self._hash_pool.shutdown(wait=True, cancel_futures=True)
+                self._hash_pool = None
+                logger.info("Password hashing pool stopped")
+    
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a password in the process pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_hash_pool(), _hash_in_worker, password)
+    
+    async def verify_and_update_password_async(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verify a password in the process pool, returning a replacement hash if needed"""
+        key = self._verify_cache_key(plain_password, hashed_password)
+        cached = self._cached_verification(key)
+        if cached is not None and not (cached and self.pwd_context.needs_update(hashed_password)):
+            return cached, None
+        
+        loop = asyncio.get_running_loop()
+        verified, new_hash = await loop.run_in_executor(
+            self._get_hash_pool(), _verify_and_update_in_worker, plain_password, hashed_password
+        )
+        self._store_verification(key, verified)
+        return verified, new_hash
+    
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password in the process pool"""
+        verified, _ = await self.verify_and_update_password_async(plain_password, hashed_password)
+        return verified
     
     def create_access_token(
         self,
@@ -68,13 +270,14 @@ class AuthService:
     ) -> str:
         """Create a JWT access token"""
         to_encode = data.copy()
+        now = self._now()
         
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = now + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
+            expire = now + timedelta(minutes=self.access_token_expire_minutes)
         
-        to_encode.update({"exp": expire, "iat": datetime.utcnow()})
+        to_encode.update({"exp": expire, "iat": now})
         
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
         return encoded_jwt
@@ -85,6 +288,12 @@ class AuthService:
     
     def verify_token(self, token: str) -> TokenData:
         """Verify and decode a JWT token"""
+        key = _token_digest(token)
+        with self._token_lock:
+            cached = self._token_cache.get(key)
+        if cached is not None:
+            return cached[1]
+        
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
             user_id: int = payload.get("user_id")
@@ -95,60 +304,107 @@ class AuthService:
             if user_id is None or username is None:
                 raise AuthenticationError("Invalid token payload")
             
-            return TokenData(
+            token_data = TokenData(
                 user_id=user_id,
                 username=username,
                 role=UserRole(role) if role else None,
                 session_id=session_id
             )
+            
+            exp = payload.get("exp")
+            if exp is not None:
+                expires_at = time.monotonic() + (exp - time.time())
+                with self._token_lock:
+                    self._token_cache[key] = (expires_at, token_data)
+            
+            return token_data
         except JWTError as e:
             logger.warning(f"JWT verification failed: {str(e)}")
             raise AuthenticationError("Could not validate credentials")
     
+    def _evict_cached_tokens(self, session_id: Optional[str] = None, user_id: Optional[int] = None):
+        """Drop cached token decodes belonging to a session or user"""
+        with self._token_lock:
+            stale = [
+                key for key, (_, data) in self._token_cache.items()
+                if (session_id is not None and data.session_id == session_id)
+                or (user_id is not None and data.user_id == user_id)
+            ]
+            for key in stale:
+                self._token_cache.pop(key, None)
+    
     def get_user_by_username(self, db: Session, username: str) -> Optional[User]:
         """Get user by username"""
-        return db.query(User).filter(User.username == username).first()
+        return db.execute(select(User).where(User.username == username)).scalar_one_or_none()
     
     def get_user_by_email(self, db: Session, email: str) -> Optional[User]:
         """Get user by email"""
-        return db.query(User).filter(User.email == email).first()
+        return db.execute(select(User).where(User.email == email)).scalar_one_or_none()
     
     def get_user_by_id(self, db: Session, user_id: int) -> Optional[User]:
-        """Get user by ID"""
-        return db.query(User).filter(User.id == user_id).first()
+        """Get user by ID (served from the identity map when already loaded)"""
+        return db.get(User, user_id)
     
-    def create_user(self, db: Session, user_create: UserCreate) -> User:
-        """Create a new user"""
-        # Check if user already exists
+    def _raise_duplicate_user(self, db: Session, user_create: UserCreate):
+        """Report which unique field a rejected user insert collided on"""
         if self.get_user_by_username(db, user_create.username):
             raise AuthenticationError("Username already registered")
         
         if self.get_user_by_email(db, user_create.email):
             raise AuthenticationError("Email already registered")
         
-        # Create new user
+        raise AuthenticationError("Employee ID already registered")
+    
+    def create_user(self, db: Session, user_create: UserCreate) -> User:
+        """Create a new user"""
         hashed_password = self.hash_password(user_create.password)
+        return self._add_user(db, user_create, hashed_password)
+    
+    async def create_user_async(self, db: Session, user_create: UserCreate) -> User:
+        """Create a new user, hashing the password in the process pool"""
+        hashed_password = await self.hash_password_async(user_create.password)
+        return self._add_user(db, user_create, hashed_password)
+    
+    def _add_user(self, db: Session, user_create: UserCreate, hashed_password: str) -> User:
+        """Insert a new user, letting the unique indexes reject duplicates"""
+        values = {
+            "email": user_create.email,
+            "username": user_create.username,
+            "full_name": user_create.full_name,
+            "hashed_password": hashed_password,
+            "role": user_create.role,
+            "department": user_create.department,
+            "employee_id": user_create.employee_id,
+            "uuid": str(uuid7())
+        }
         
-        db_user = User(
-            email=user_create.email,
-            username=user_create.username,
-            full_name=user_create.full_name,
-            hashed_password=hashed_password,
-            role=user_create.role,
-            department=user_create.department,
-            employee_id=user_create.employee_id,
-            uuid=str(uuid.uuid4())
-        )
+        # ON CONFLICT DO NOTHING where supported; elsewhere the unique
+        # constraint surfaces as an IntegrityError instead
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            stmt = pg_insert(User).values(**values).on_conflict_do_nothing()
+        elif dialect == "sqlite":
+            stmt = sqlite_insert(User).values(**values).on_conflict_do_nothing()
+        else:
+            stmt = insert(User).values(**values)
+        
+        # RETURNING populates the ORM object, including server defaults
+        try:
+            db_user = db.execute(stmt.returning(User)).scalar_one_or_none()
+        except IntegrityError:
+            db_user = None
+        
+        if db_user is None:
+            db.rollback()
+            self._raise_duplicate_user(db, user_create)
         
-        db.add(db_user)
         db.commit()
-        db.refresh(db_user)
         
         logger.info(f"New user created: {user_create.username} ({user_create.email})")
         return db_user
     
-    def authenticate_user(self, db: Session, username: str, password: str) -> Optional[User]:
-        """Authenticate a user with username and password"""
+    def _get_login_candidate(self, db: Session, username: str) -> Optional[User]:
+        """Get the active user a login attempt refers to"""
         user = self.get_user_by_username(db, username)
         
         if not user:
@@ -159,13 +415,62 @@ class AuthService:
             logger.warning(f"Authentication failed: user inactive - {username}")
             return None
         
-        if not self.verify_password(password, user.hashed_password):
+        return user
+    
+    def authenticate_user(
+        self,
+        db: Session,
+        username: str,
+        password: str,
+        commit: bool = True
+    ) -> Optional[User]:
+        """Authenticate a user with username and password"""
+        user = self._get_login_candidate(db, username)
+        if not user:
+            return None
+        
+        verified, new_hash = self.verify_and_update_password(password, user.hashed_password)
+        return self._complete_login(db, user, verified, new_hash, commit)
+    
+    async def authenticate_user_async(
+        self,
+        db: Session,
+        username: str,
+        password: str,
+        commit: bool = True
+    ) -> Optional[User]:
+        """Authenticate a user, verifying the password in the process pool"""
+        user = self._get_login_candidate(db, username)
+        if not user:
+            return None
+        
+        verified, new_hash = await self.verify_and_update_password_async(password, user.hashed_password)
+        return self._complete_login(db, user, verified, new_hash, commit)
+    
+    def _complete_login(
+        self,
+        db: Session,
+        user: User,
+        verified: bool,
+        new_hash: Optional[str],
+        commit: bool = True
+    ) -> Optional[User]:
+        """Record the outcome of a password check for a login attempt"""
+        username = user.username
+        if not verified:
             logger.warning(f"Authentication failed: invalid password - {username}")
             return None
         
-        # Update last login
-        user.last_login = datetime.utcnow()
-        db.commit()
+        # Upgrade legacy bcrypt hashes to Argon2id
+        if new_hash:
+            user.hashed_password = new_hash
+            logger.info(f"Password hash upgraded for user: {username}")
+        
+        # Update last login; with commit=False the caller's next commit
+        # (e.g. create_user_session) persists it in the same transaction
+        user.last_login = self._now()
+        if commit:
+            db.commit()
         
         logger.info(f"User authenticated successfully: {username}")
         return user
@@ -178,8 +483,8 @@ class AuthService:
         user_agent: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create a new user session with tokens"""
-        session_id = str(uuid.uuid4())
-        expires_at = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
+        session_id = str(uuid7())
+        expires_at = self._now() + timedelta(minutes=self.access_token_expire_minutes)
         
         # Create token payload
         token_data = {
@@ -197,16 +502,17 @@ class AuthService:
         session = UserSession(
             session_id=session_id,
             user_id=user.id,
-            access_token=access_token,
+            access_token_hash=_token_digest(access_token),
             refresh_token=refresh_token,
+            refresh_token_hash=_token_digest(refresh_token),
             expires_at=expires_at,
             ip_address=ip_address,
             user_agent=user_agent
         )
         
+        # Nothing server-generated is read back, so no refresh is needed
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         logger.info(f"Session created for user: {user.username} (session: {session_id})")
         
@@ -219,13 +525,114 @@ class AuthService:
             "user": user
         }
     
-    def get_active_session(self, db: Session, session_id: str) -> Optional[UserSession]:
-        """Get active session by session ID"""
-        return db.query(UserSession).filter(
+    def create_user_sessions_bulk(
+        self,
+        db: Session,
+        users: List[User],
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Create sessions for many users (e.g. SSO provisioning) in one transaction"""
+        now = self._now()
+        expires_at = now + timedelta(minutes=self.access_token_expire_minutes)
+        
+        rows = []
+        results = []
+        for user in users:
+            session_id = str(uuid7())
+            access_token = self.create_access_token({
+                "user_id": user.id,
+                "username": user.username,
+                "role": user.role.value,
+                "session_id": session_id
+            })
+            refresh_token = self.create_refresh_token()
+            
+            rows.append({
+                "session_id": session_id,
+                "user_id": user.id,
+                "access_token_hash": _token_digest(access_token),
+                "refresh_token": refresh_token,
+                "refresh_token_hash": _token_digest(refresh_token),
+                "expires_at": expires_at,
+                "created_at": now,
+                "last_accessed": now,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+                "is_active": True
+            })
+            results.append({
+                "access_token": access_token,
+                "refresh_token": refresh_token,
+                "token_type": "bearer",
+                "expires_in": self.access_token_expire_minutes * 60,
+                "session_id": session_id,
+                "user": user
+            })
+        
+        if not rows:
+            return results
+        
+        try:
+            if db.get_bind().dialect.name == "postgresql":
+                self._copy_session_rows(db, rows)
+            else:
+                for start in range(0, len(rows), SESSION_INSERT_BATCH_SIZE):
+                    db.bulk_insert_mappings(UserSession, rows[start:start + SESSION_INSERT_BATCH_SIZE])
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        
+        logger.info(f"Bulk created {len(rows)} sessions")
+        return results
+    
+    def _copy_session_rows(self, db: Session, rows: List[Dict[str, Any]]):
+        """Stream session rows into Postgres with COPY inside the session's transaction"""
+        columns = list(rows[0].keys())
+        
+        def copy_value(value):
+            if value is None:
+                return None
+            if isinstance(value, bytes):
+                return "\\x" + value.hex()
+            if isinstance(value, bool):
+                return "t" if value else "f"
+            if isinstance(value, datetime):
+                return value.isoformat()
+            return value
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([copy_value(row[column]) for column in columns])
+        buffer.seek(0)
+        
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {UserSession.__tablename__} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+        finally:
+            cursor.close()
+    
+    def get_active_session(
+        self,
+        db: Session,
+        session_id: str,
+        load_user: bool = False
+    ) -> Optional[UserSession]:
+        """Get active session by session ID, optionally loading its user in the same query"""
+        query = db.query(UserSession)
+        if load_user:
+            query = query.options(joinedload(UserSession.user))
+        
+        return query.filter(
             and_(
                 UserSession.session_id == session_id,
                 UserSession.is_active == True,
-                UserSession.expires_at > datetime.utcnow()
+                UserSession.expires_at > self._now()
             )
         ).first()
     
@@ -238,6 +645,7 @@ class AuthService:
         if session:
             session.is_active = False
             db.commit()
+            self._evict_cached_tokens(session_id=session_id)
             logger.info(f"Session invalidated: {session_id}")
             return True
         
@@ -245,16 +653,22 @@ class AuthService:
     
     def invalidate_all_user_sessions(self, db: Session, user_id: int) -> int:
         """Invalidate all sessions for a user"""
-        count = db.query(UserSession).filter(
-            and_(
-                UserSession.user_id == user_id,
-                UserSession.is_active == True
+        session_ids = db.execute(
+            update(UserSession)
+            .where(
+                and_(
+                    UserSession.user_id == user_id,
+                    UserSession.is_active == True
+                )
             )
-        ).update({"is_active": False})
+            .values(is_active=False)
+            .returning(UserSession.session_id)
+        ).scalars().all()
         
         db.commit()
-        logger.info(f"Invalidated {count} sessions for user ID: {user_id}")
-        return count
+        self._evict_cached_tokens(user_id=user_id)
+        logger.info(f"Invalidated {len(session_ids)} sessions for user ID: {user_id} ({', '.join(session_ids)})")
+        return len(session_ids)
     
     def refresh_access_token(
         self,
@@ -263,16 +677,18 @@ class AuthService:
         session_id: str
     ) -> Optional[Dict[str, Any]]:
         """Refresh an access token using refresh token"""
-        session = db.query(UserSession).filter(
+        session = db.query(UserSession).options(
+            joinedload(UserSession.user)
+        ).filter(
             and_(
                 UserSession.session_id == session_id,
-                UserSession.refresh_token == refresh_token,
+                UserSession.refresh_token_hash == _token_digest(refresh_token),
                 UserSession.is_active == True,
-                UserSession.expires_at > datetime.utcnow()
+                UserSession.expires_at > self._now()
             )
         ).first()
         
-        if not session:
+        if not session or not hmac.compare_digest(session.refresh_token or "", refresh_token):
             logger.warning(f"Refresh token validation failed for session: {session_id}")
             return None
         
@@ -282,7 +698,8 @@ class AuthService:
             return None
         
         # Create new tokens
-        new_expires_at = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
+        now = self._now()
+        new_expires_at = now + timedelta(minutes=self.access_token_expire_minutes)
         
         token_data = {
             "user_id": user.id,
@@ -295,10 +712,12 @@ class AuthService:
         new_refresh_token = self.create_refresh_token()
         
         # Update session
-        session.access_token = new_access_token
+        session.access_token_hash = _token_digest(new_access_token)
+        session.access_token = None
         session.refresh_token = new_refresh_token
+        session.refresh_token_hash = _token_digest(new_refresh_token)
         session.expires_at = new_expires_at
-        session.last_accessed = datetime.utcnow()
+        session.last_accessed = now
         
         db.commit()
         
@@ -309,7 +728,8 @@ class AuthService:
             "refresh_token": new_refresh_token,
             "token_type": "bearer",
             "expires_in": self.access_token_expire_minutes * 60,
-            "session_id": session_id
+            "session_id": session_id,
+            "user": user
         }
     
     def check_permission(
@@ -321,17 +741,59 @@ class AuthService:
         """Check if user role has permission to access specific data"""
         return ROLE_PERMISSIONS.can_access_department(user_role, department)
     
-    def get_user_permissions(self, user_role: UserRole) -> Dict[str, List[str]]:
-        """Get all permissions for a user role"""
-        return ROLE_PERMISSIONS.get_permissions(user_role)
+    def get_user_permissions(self, user_role: UserRole) -> Dict[str, Any]:
+        """Get all permissions for a user role as a JSON-ready dict"""
+        return {
+            key: sorted(value) if isinstance(value, frozenset) else list(value) if isinstance(value, tuple) else value
+            for key, value in ROLE_PERMISSIONS.get_permissions(user_role).items()
+        }
     
-    def cleanup_expired_sessions(self, db: Session) -> int:
-        """Clean up expired sessions"""
-        count = db.query(UserSession).filter(
-            UserSession.expires_at < datetime.utcnow()
-        ).delete()
+    def bulk_insert_chat_history(
+        self,
+        db: Session,
+        rows: List[Dict[str, Any]],
+        batch_size: int = CHAT_HISTORY_INSERT_BATCH_SIZE
+    ) -> int:
+        """Insert chat history rows in batches within a single transaction"""
+        if not rows:
+            return 0
+        
+        try:
+            for start in range(0, len(rows), batch_size):
+                db.bulk_insert_mappings(ChatHistory, rows[start:start + batch_size])
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        
+        logger.debug(f"Bulk inserted {len(rows)} chat history rows")
+        return len(rows)
+    
+    def cleanup_expired_sessions(
+        self,
+        db: Session,
+        batch_size: int = SESSION_CLEANUP_BATCH_SIZE
+    ) -> int:
+        """Clean up expired sessions in short batched transactions"""
+        now = self._now()
+        expired_ids = (
+            select(UserSession.id)
+            .where(UserSession.expires_at < now)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        
+        count = 0
+        while True:
+            deleted = db.execute(
+                delete(UserSession).where(UserSession.id.in_(expired_ids)),
+                execution_options={"synchronize_session": False}
+            ).rowcount
+            db.commit()
+            count += deleted
+            if deleted < batch_size:
+                break
         
-        db.commit()
         logger.info(f"Cleaned up {count} expired sessions")
         return count
 
@@ -8,11 +8,31 @@ Version: 1.0.0
 """
 
 import os
-from typing import List, Optional, Dict, Any
-from pydantic import Field, field_validator
+import re
+import hashlib
+from pathlib import Path
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Mapping
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings
 from enum import Enum
 import json
+import orjson
+
+
+# Comma separator with surrounding whitespace, for list settings given as plain strings
+_LIST_DELIMITER = re.compile(r"\s*,\s*")
+
+# Settings that accept a JSON array or comma-separated string
+_LIST_FIELDS = ("cors_origins", "supported_file_types")
+
+
+def _parse_list_field(value: str) -> Any:
+    """Parse a JSON array, falling back to a comma-separated list"""
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return _LIST_DELIMITER.split(value.strip())
 
 
 class Environment(str, Enum):
@@ -84,6 +104,9 @@ class Settings(BaseSettings):
     algorithm: str = Field(default="HS256", env="ALGORITHM")
     access_token_expire_minutes: int = Field(default=30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
     bcrypt_rounds: int = Field(default=12, env="BCRYPT_ROUNDS")
+    argon2_time_cost: int = Field(default=2, env="ARGON2_TIME_COST")
+    argon2_memory_cost: int = Field(default=19456, env="ARGON2_MEMORY_COST")  # KiB
+    argon2_parallelism: int = Field(default=1, env="ARGON2_PARALLELISM")
     
     # Database Configuration
     database_url: str = Field(default="sqlite:///./finsolve_rbac.db", env="DATABASE_URL")
@@ -104,26 +127,11 @@ class Settings(BaseSettings):
     streamlit_host: str = Field(default="localhost", env="STREAMLIT_HOST")
     streamlit_port: int = Field(default=8501, env="STREAMLIT_PORT")
 
-    # Public URLs (for display purposes)
-    @property
-    def streamlit_url(self) -> str:
-        """Get the public Streamlit URL"""
-        return f"http://localhost:{self.streamlit_port}"
-
-    @property
-    def api_url(self) -> str:
-        """Get the public API URL"""
-        return f"http://localhost:{self.langserve_port}"
-
-    @property
-    def docs_url(self) -> str:
-        """Get the API documentation URL"""
-        return f"http://localhost:{self.langserve_port}/docs"
-
-    @property
-    def langserve_playground_url(self) -> str:
-        """Get the LangServe playground URL"""
-        return f"http://localhost:{self.langserve_port}/langserve/chat/playground"
+    # Public URLs (for display purposes), derived from the ports in model_post_init
+    streamlit_url: str = Field(default="", exclude=True)
+    api_url: str = Field(default="", exclude=True)
+    docs_url: str = Field(default="", exclude=True)
+    langserve_playground_url: str = Field(default="", exclude=True)
     
     # CORS Configuration
     cors_origins: List[str] = Field(
@@ -160,27 +168,16 @@ class Settings(BaseSettings):
     smtp_port: int = Field(default=587, env="SMTP_PORT")
     email_use_tls: bool = Field(default=True, env="EMAIL_USE_TLS")
     
-    @field_validator("cors_origins", mode="before")
-    @classmethod
-    def parse_cors_origins(cls, v):
-        """Parse CORS origins from string or list"""
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                return [origin.strip() for origin in v.split(",")]
-        return v
-    
-    @field_validator("supported_file_types", mode="before")
+    @model_validator(mode="before")
     @classmethod
-    def parse_file_types(cls, v):
-        """Parse supported file types from string or list"""
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                return [ft.strip() for ft in v.split(",")]
-        return v
+    def _coerce_lists(cls, data):
+        """Normalize list settings given as strings in one pass over the input"""
+        if isinstance(data, dict):
+            for key in _LIST_FIELDS:
+                value = data.get(key)
+                if isinstance(value, str):
+                    data[key] = _parse_list_field(value)
+        return data
     
     @field_validator("secret_key")
     @classmethod
@@ -198,11 +195,62 @@ class Settings(BaseSettings):
             raise ValueError("Similarity threshold must be between 0.0 and 1.0")
         return v
     
+    def model_post_init(self, __context: Any) -> None:
+        """Build the public URLs once so later reads are plain attribute loads"""
+        self.__dict__.update(
+            streamlit_url=f"http://localhost:{self.streamlit_port}",
+            api_url=f"http://localhost:{self.langserve_port}",
+            docs_url=f"http://localhost:{self.langserve_port}/docs",
+            langserve_playground_url=f"http://localhost:{self.langserve_port}/langserve/chat/playground"
+        )
+    
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
-        "case_sensitive": False
+        "case_sensitive": False,
+        "frozen": True
+    }
+
+
+# Lower-cased lookup keys; bounded so arbitrary caller input cannot grow it
+_LOWER_CACHE: Dict[str, str] = {}
+_LOWER_CACHE_MAX = 1024
+
+
+def _norm(value: Optional[str]) -> str:
+    """Lower-case a lookup key, memoizing the common canonical values"""
+    if value is None:
+        return ""
+    cached = _LOWER_CACHE.get(value)
+    if cached is None:
+        cached = value.lower()
+        if len(_LOWER_CACHE) < _LOWER_CACHE_MAX:
+            _LOWER_CACHE.setdefault(value, cached)
+    return cached
+
+
+def _freeze_permissions(permissions: Dict[str, Any]) -> Mapping[str, Any]:
+    """Freeze one role's permissions: frozensets for membership sets, tuples for ordered lists"""
+    frozen = {}
+    for key, value in permissions.items():
+        if key in ("departments", "data_types"):
+            frozen[key] = frozenset(value)
+        elif isinstance(value, list):
+            frozen[key] = tuple(value)
+        else:
+            frozen[key] = value
+    return MappingProxyType(frozen)
+
+
+def _permission_bitmasks(permissions: Mapping[UserRole, Mapping[str, Any]], key: str):
+    """Assign one bit per distinct value of key and OR them into a mask per role; "all" sets every bit"""
+    values = sorted({value for role_permissions in permissions.values() for value in role_permissions[key]} - {"all"})
+    bits = {value: 1 << index for index, value in enumerate(values)}
+    masks = {
+        role: -1 if "all" in role_permissions[key] else sum(bits[value] for value in role_permissions[key])
+        for role, role_permissions in permissions.items()
     }
+    return bits, masks
 
 
 class RolePermissions:
@@ -211,7 +259,7 @@ class RolePermissions:
     Defines what data each role can access
     """
     
-    PERMISSIONS: Dict[UserRole, Dict[str, List[str]]] = {
+    PERMISSIONS: Mapping[UserRole, Mapping[str, Any]] = {
         UserRole.EMPLOYEE: {
             "departments": ["general"],
             "data_types": ["policies", "handbook", "announcements", "faqs"],
@@ -306,32 +354,78 @@ class RolePermissions:
         }
     }
     
+    # Read-only table with O(1) membership for departments and data types
+    PERMISSIONS = MappingProxyType({
+        role: _freeze_permissions(permissions) for role, permissions in PERMISSIONS.items()
+    })
+    
+    # Bit per department / data type and the OR-ed mask each role may access
+    _DEPT_BIT, _ROLE_DEPT_MASK = _permission_bitmasks(PERMISSIONS, "departments")
+    _DATA_TYPE_BIT, _ROLE_DATA_TYPE_MASK = _permission_bitmasks(PERMISSIONS, "data_types")
+    
     @classmethod
-    def get_permissions(cls, role: UserRole) -> Dict[str, List[str]]:
+    def get_permissions(cls, role: UserRole) -> Mapping[str, Any]:
         """Get permissions for a specific role"""
         return cls.PERMISSIONS.get(role, cls.PERMISSIONS[UserRole.EMPLOYEE])
     
     @classmethod
     def can_access_department(cls, role: UserRole, department: str) -> bool:
         """Check if role can access specific department"""
-        permissions = cls.get_permissions(role)
-        return department.lower() in permissions["departments"]
+        mask = cls._ROLE_DEPT_MASK.get(role, cls._ROLE_DEPT_MASK[UserRole.EMPLOYEE])
+        return bool(mask & cls._DEPT_BIT.get(_norm(department), 0))
     
     @classmethod
     def can_access_data_type(cls, role: UserRole, data_type: str) -> bool:
         """Check if role can access specific data type"""
-        permissions = cls.get_permissions(role)
-        return "all" in permissions["data_types"] or data_type.lower() in permissions["data_types"]
+        mask = cls._ROLE_DATA_TYPE_MASK.get(role, cls._ROLE_DATA_TYPE_MASK[UserRole.EMPLOYEE])
+        return mask == -1 or bool(mask & cls._DATA_TYPE_BIT.get(_norm(data_type), 0))
     
     @classmethod
-    def get_restricted_fields(cls, role: UserRole) -> List[str]:
+    def get_restricted_fields(cls, role: UserRole) -> tuple:
         """Get list of restricted fields for role"""
         permissions = cls.get_permissions(role)
         return permissions["restricted_fields"]
 
 
+SETTINGS_CACHE_DIR = Path.home() / ".cache" / "finsolve"
+
+
+def _load_cached_settings() -> Settings:
+    """
+    Load settings, reusing a validated snapshot when FINSOLVE_SETTINGS_CACHE=1.
+    The snapshot is keyed by the .env contents and the process environment, and
+    holds secrets, so it is written owner-readable only.
+    """
+    if os.environ.get("FINSOLVE_SETTINGS_CACHE") != "1":
+        return Settings()
+    
+    env_file = Path(Settings.model_config.get("env_file", ".env"))
+    env_bytes = env_file.read_bytes() if env_file.is_file() else b""
+    environ_bytes = json.dumps(sorted(os.environ.items())).encode()
+    key = hashlib.blake2b(env_bytes + environ_bytes, digest_size=16).hexdigest()
+    cache_file = SETTINGS_CACHE_DIR / f"settings-{key}.json"
+    
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        cached["environment"] = Environment(cached["environment"])
+        cached["log_level"] = LogLevel(cached["log_level"])
+        return Settings.model_construct(**cached)
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    loaded = Settings()
+    try:
+        SETTINGS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(loaded.model_dump_json())
+    except OSError:
+        pass
+    return loaded
+
+
 # Global settings instance
-settings = Settings()
+settings = _load_cached_settings()
 
 # Export commonly used configurations
 ROLE_PERMISSIONS = RolePermissions()
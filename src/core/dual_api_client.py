@@ -8,37 +8,83 @@ Version: 1.0.0
 """
 
 import os
+import re
 import time
+import signal
+import asyncio
+import atexit
+import json
+import struct
+import hashlib
 import threading
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
-from datetime import datetime
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from typing import Optional, Dict, Any, List, Callable, Literal
+from dataclasses import dataclass, field, replace
 from loguru import logger
+import httpx
 
 from .config import settings
 
-# Try to import OpenAI
-try:
-    import openai
-    OPENAI_AVAILABLE = True
+
+# Provider SDKs are imported on first use so unused paths cost nothing at startup
+@functools.cache
+def _openai_available() -> bool:
+    """Try to import OpenAI once"""
+    try:
+        import openai
+    except ImportError:
+        logger.info("OpenAI library not available - using Euri API only")
+        return False
     logger.info(f"OpenAI library available (version: {getattr(openai, '__version__', 'unknown')})")
-except ImportError:
-    OPENAI_AVAILABLE = False
-    openai = None
-    logger.info("OpenAI library not available - using Euri API only")
+    return True
+
+
+@functools.cache
+def _euriai_available() -> bool:
+    """Try to import Euriai LangChain once"""
+    try:
+        import euriai  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+from . import euri_client as euri_module
+from .euri_client import HTTP2_AVAILABLE
+
+# Prompt prefixes per chat role; messages with other roles are dropped
+_ROLE_PREFIX = {"system": "System: ", "user": "User: ", "assistant": "Assistant: "}
+
+# Successful deterministic (temperature 0) completions kept in memory
+RESPONSE_CACHE_MAXSIZE = 512
+
+# POSIX interval timers let a main-thread call be interrupted in place
+SIGALRM_AVAILABLE = hasattr(signal, "setitimer")
 
-# Try to import Euriai LangChain
-try:
-    from euriai import EuriaiLangChainLLM
-    EURIAI_LANGCHAIN_AVAILABLE = True
-except ImportError:
-    EURIAI_LANGCHAIN_AVAILABLE = False
-    EuriaiLangChainLLM = None
+# Conversation prompts kept for incremental multi-turn rebuilds
+PROMPT_CACHE_MAXSIZE = 256
 
-from .euri_client import euri_client
+# Seconds to wait on Euriai before hedging the request to OpenAI
+HEDGE_DELAY = 0.5
 
+# Connection pool shared by every OpenAI request
+OPENAI_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=64,
+    keepalive_expiry=120.0
+)
 
-@dataclass
+# Euriai failure kinds meaning the Euri backend itself is unavailable
+EURI_BACKEND_DOWN_KINDS = frozenset({"timeout", "rate_limit", "server"})
+_SERVER_ERROR_RE = re.compile(r"\b5\d\d\b")
+
+# Consecutive failures that open a provider's circuit, and how long it stays open
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_COOLDOWN = 30.0
+
+
+@dataclass(slots=True, kw_only=True)
 class APIResponse:
     """Standardized API response"""
     success: bool
@@ -47,7 +93,67 @@ class APIResponse:
     response_time: float
     model: str
     error: Optional[str] = None
-    metadata: Dict[str, Any] = None
+    error_kind: Optional[Literal["timeout", "rate_limit", "server", "other"]] = None
+    metadata_factory: Optional[Callable[[], Dict[str, Any]]] = field(default=None, repr=False)
+    _metadata: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def metadata(self) -> Optional[Dict[str, Any]]:
+        """Response metadata, built on first access"""
+        if self._metadata is None and self.metadata_factory is not None:
+            self._metadata = self.metadata_factory()
+        return self._metadata
+
+
+def _classify_error(message: str) -> str:
+    """Bucket a provider error message into timeout / rate_limit / server / other"""
+    lowered = message.lower()
+    if "timeout" in lowered or "timed out" in lowered:
+        return "timeout"
+    if "429" in lowered or "rate limit" in lowered:
+        return "rate_limit"
+    if _SERVER_ERROR_RE.search(lowered):
+        return "server"
+    return "other"
+
+
+def _raise_timeout(signum, frame):
+    """SIGALRM handler that unwinds the interrupted call"""
+    raise TimeoutError
+
+
+def circuit_breaker(api_name: str, model: str):
+    """Skip a provider while its circuit is open and record each attempt's outcome"""
+    def decorator(func):
+        def short_circuit() -> APIResponse:
+            return APIResponse(
+                success=False,
+                content="",
+                api_used=api_name,
+                response_time=0.0,
+                model=model,
+                error="circuit open"
+            )
+        
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                if self._circuit_open(api_name):
+                    return short_circuit()
+                response = await func(self, *args, **kwargs)
+                self._record_attempt(api_name, response.success)
+                return response
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self._circuit_open(api_name):
+                return short_circuit()
+            response = func(self, *args, **kwargs)
+            self._record_attempt(api_name, response.success)
+            return response
+        return wrapper
+    return decorator
 
 
 class DualAPIClient:
@@ -62,7 +168,8 @@ class DualAPIClient:
         
         # Initialize Euriai LangChain if available
         self.euriai_llm = None
-        if EURIAI_LANGCHAIN_AVAILABLE and self.euri_api_key:
+        if self.euri_api_key and _euriai_available():
+            from euriai import EuriaiLangChainLLM
             try:
                 self.euriai_llm = EuriaiLangChainLLM(
                     api_key=self.euri_api_key,
@@ -76,10 +183,17 @@ class DualAPIClient:
         
         # Initialize OpenAI if available
         self.openai_client = None
-        if OPENAI_AVAILABLE and self.openai_api_key:
+        self._openai_http = None
+        self._openai_async_http = None
+        if self.openai_api_key and _openai_available():
+            import openai
+            # Pooled keepalive transports so TLS setup is amortized across requests
+            self._openai_http = httpx.Client(http2=HTTP2_AVAILABLE, limits=OPENAI_HTTP_LIMITS)
+            self._openai_async_http = httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=OPENAI_HTTP_LIMITS)
+            atexit.register(self._openai_http.close)
             try:
                 # Try with basic initialization first to avoid compatibility issues
-                self.openai_client = openai.OpenAI(api_key=self.openai_api_key)
+                self.openai_client = openai.OpenAI(api_key=self.openai_api_key, http_client=self._openai_http)
                 logger.info("OpenAI client initialized successfully")
             except TypeError as e:
                 # Handle version compatibility issues
@@ -100,8 +214,89 @@ class DualAPIClient:
                 logger.warning(f"Failed to initialize OpenAI client: {str(e)}")
                 self.openai_client = None
         
+        # Async OpenAI client for hedged requests
+        self.async_openai_client = None
+        if self.openai_client:
+            import openai
+            try:
+                self.async_openai_client = openai.AsyncOpenAI(
+                    api_key=self.openai_api_key,
+                    http_client=self._openai_async_http
+                )
+            except Exception as e:
+                logger.warning(f"Failed to initialize async OpenAI client: {str(e)}")
+        
+        # OpenAI clients preconfigured per timeout, sharing the pooled transports
+        self._openai_by_timeout: Dict[float, Any] = {}
+        self._async_openai_by_timeout: Dict[float, Any] = {}
+        
+        # Reusable worker threads for timed Euriai calls
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.euri_rate_limit,
+            thread_name_prefix="euriai"
+        )
+        atexit.register(self._executor.shutdown, wait=False)
+        
+        # Per-provider circuit breaker state
+        self._breaker = {
+            name: {"fails": 0, "open_until": 0.0}
+            for name in ("euriai", "euri_client", "openai")
+        }
+        self._breaker_lock = threading.Lock()
+        
+        # LRU of rendered prompts keyed by a rolling hash of the conversation
+        self._prompt_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._prompt_cache_lock = threading.Lock()
+        
+        # LRU of successful temperature-0 responses keyed by request digest
+        self._response_cache: "OrderedDict[bytes, APIResponse]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        
         logger.info(f"Dual API client initialized - Euri: {bool(self.euriai_llm)}, OpenAI: {bool(self.openai_client)}")
     
+    def _circuit_open(self, api_name: str) -> bool:
+        """Whether calls to a provider are currently short-circuited"""
+        return time.monotonic() < self._breaker[api_name]["open_until"]
+    
+    def _record_attempt(self, api_name: str, success: bool):
+        """Reset a provider's failure count or open its circuit after repeated failures"""
+        with self._breaker_lock:
+            state = self._breaker[api_name]
+            if success:
+                state["fails"] = 0
+                return
+            state["fails"] += 1
+            if state["fails"] >= CIRCUIT_FAILURE_THRESHOLD:
+                state["open_until"] = time.monotonic() + CIRCUIT_COOLDOWN
+                state["fails"] = 0
+                logger.warning(f"{api_name} circuit opened for {CIRCUIT_COOLDOWN:.0f}s after repeated failures")
+    
+    def _response_cache_key(self, messages: List[Dict[str, str]], temperature: float, max_tokens: int) -> bytes:
+        """Stable digest of a completion request"""
+        payload = json.dumps(messages, sort_keys=True).encode() + struct.pack("di", temperature, max_tokens)
+        return hashlib.blake2b(payload, digest_size=16).digest()
+    
+    def _get_cached_response(self, key: bytes) -> Optional[APIResponse]:
+        """Return a cached response, refreshing its LRU position"""
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+        return cached
+    
+    def _store_cached_response(self, key: bytes, response: APIResponse):
+        """Cache a successful response, evicting the least recently used"""
+        with self._response_cache_lock:
+            self._response_cache[key] = response
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > RESPONSE_CACHE_MAXSIZE:
+                self._response_cache.popitem(last=False)
+    
+    def cache_clear(self):
+        """Drop all cached completions"""
+        with self._response_cache_lock:
+            self._response_cache.clear()
+    
     def chat_completion(
         self,
         messages: List[Dict[str, str]],
@@ -114,6 +309,29 @@ class DualAPIClient:
         Tries Euri first, then OpenAI if Euri fails
         """
         
+        # Only deterministic requests are answered from the response cache
+        if temperature != 0.0:
+            return self._complete_uncached(messages, temperature, max_tokens, timeout)
+        
+        cache_key = self._response_cache_key(messages, temperature, max_tokens)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return replace(cached, response_time=0.0)
+        
+        response = self._complete_uncached(messages, temperature, max_tokens, timeout)
+        if response.success:
+            self._store_cached_response(cache_key, response)
+        return response
+    
+    def _complete_uncached(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        timeout: int
+    ) -> APIResponse:
+        """Run the Euriai -> Euri client -> OpenAI fallback chain"""
+        
         # Convert messages to prompt for single-prompt APIs
         prompt = self._messages_to_prompt(messages)
         
@@ -122,10 +340,11 @@ class DualAPIClient:
         if euri_response.success:
             return euri_response
         
-        # Try regular Euri client
-        euri_client_response = self._try_euri_client(messages, temperature, max_tokens)
-        if euri_client_response.success:
-            return euri_client_response
+        # Try regular Euri client, unless Euriai showed the shared backend is down
+        if euri_response.error_kind not in EURI_BACKEND_DOWN_KINDS:
+            euri_client_response = self._try_euri_client(messages, temperature, max_tokens)
+            if euri_client_response.success:
+                return euri_client_response
         
         # Fallback to OpenAI
         openai_response = self._try_openai(messages, temperature, max_tokens, timeout)
@@ -142,6 +361,90 @@ class DualAPIClient:
             error=f"All APIs failed - Euri: {euri_response.error}, OpenAI: {openai_response.error}"
         )
     
+    async def achat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        timeout: int = 30,
+        hedge_delay: float = HEDGE_DELAY
+    ) -> APIResponse:
+        """
+        Async chat completion with hedged requests
+        Starts Euriai, hedges to OpenAI after hedge_delay and returns the first success
+        """
+        
+        # Only deterministic requests are answered from the response cache
+        if temperature != 0.0:
+            return await self._acomplete_uncached(messages, temperature, max_tokens, timeout, hedge_delay)
+        
+        cache_key = self._response_cache_key(messages, temperature, max_tokens)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return replace(cached, response_time=0.0)
+        
+        response = await self._acomplete_uncached(messages, temperature, max_tokens, timeout, hedge_delay)
+        if response.success:
+            self._store_cached_response(cache_key, response)
+        return response
+    
+    async def _acomplete_uncached(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        timeout: int,
+        hedge_delay: float
+    ) -> APIResponse:
+        """Race Euriai against a delayed OpenAI request, then fall back to the Euri client"""
+        
+        prompt = self._messages_to_prompt(messages)
+        failures = []
+        hedged = False
+        pending = {asyncio.create_task(self._a_try_euriai(prompt, temperature, max_tokens, timeout))}
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=None if hedged else hedge_delay,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    response = task.result()
+                    if response.success:
+                        return response
+                    failures.append(response)
+                
+                # Euriai is slow or failed - start OpenAI alongside it
+                if not hedged:
+                    hedged = True
+                    pending.add(asyncio.create_task(
+                        self._a_try_openai(messages, temperature, max_tokens, timeout)
+                    ))
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        # Both raced requests failed - try the regular Euri client last,
+        # unless Euriai showed the shared backend is down
+        if not any(r.api_used == "euriai" and r.error_kind in EURI_BACKEND_DOWN_KINDS for r in failures):
+            euri_client_response = await self._a_try_euri_client(messages, temperature, max_tokens)
+            if euri_client_response.success:
+                return euri_client_response
+            failures.append(euri_client_response)
+        
+        # All APIs failed
+        return APIResponse(
+            success=False,
+            content="",
+            api_used="none",
+            response_time=0.0,
+            model="none",
+            error="All APIs failed - " + ", ".join(f"{r.api_used}: {r.error}" for r in failures)
+        )
+    
+    @circuit_breaker("euriai", "gpt-4.1-nano")
     def _try_euriai(self, prompt: str, temperature: float, max_tokens: int, timeout: int) -> APIResponse:
         """Try Euriai LangChain with timeout"""
         if not self.euriai_llm:
@@ -154,116 +457,180 @@ class DualAPIClient:
                 error="Euriai LangChain not available"
             )
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
-            # Use threading for timeout on Windows
-            result = None
-            exception_occurred = None
-            
-            def euriai_call():
-                nonlocal result, exception_occurred
-                try:
-                    result = self.euriai_llm.invoke(prompt)
-                except Exception as e:
-                    exception_occurred = e
+            result = self._invoke_euriai(prompt, timeout)
+            return self._euriai_response(result, (time.perf_counter_ns() - start_ns) / 1e9)
             
-            thread = threading.Thread(target=euriai_call)
-            thread.daemon = True
-            thread.start()
-            thread.join(timeout=timeout)
-            
-            response_time = time.time() - start_time
-            
-            if thread.is_alive():
-                return APIResponse(
-                    success=False,
-                    content="",
-                    api_used="euriai",
-                    response_time=response_time,
-                    model="gpt-4.1-nano",
-                    error=f"Timeout after {timeout}s"
-                )
-            
-            if exception_occurred:
-                return APIResponse(
-                    success=False,
-                    content="",
-                    api_used="euriai",
-                    response_time=response_time,
-                    model="gpt-4.1-nano",
-                    error=str(exception_occurred)
-                )
+        except TimeoutError:
+            return APIResponse(
+                success=False,
+                content="",
+                api_used="euriai",
+                response_time=(time.perf_counter_ns() - start_ns) / 1e9,
+                model="gpt-4.1-nano",
+                error=f"Timeout after {timeout}s",
+                error_kind="timeout"
+            )
+        except Exception as e:
+            return APIResponse(
+                success=False,
+                content="",
+                api_used="euriai",
+                response_time=(time.perf_counter_ns() - start_ns) / 1e9,
+                model="gpt-4.1-nano",
+                error=str(e),
+                error_kind=_classify_error(str(e))
+            )
+    
+    def _invoke_euriai(self, prompt: str, timeout: int) -> str:
+        """Invoke Euriai, raising TimeoutError once timeout seconds have passed"""
+        # SIGALRM only reaches the main thread; it interrupts the call instead of abandoning it
+        if SIGALRM_AVAILABLE and threading.current_thread() is threading.main_thread():
+            previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+            try:
+                return self.euriai_llm.invoke(prompt)
+            finally:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+                signal.signal(signal.SIGALRM, previous_handler)
+        
+        # Elsewhere run on the shared pool so the timeout works on every platform
+        future = self._executor.submit(self.euriai_llm.invoke, prompt)
+        try:
+            return future.result(timeout=timeout)
+        except FuturesTimeout:
+            future.cancel()
+            raise TimeoutError
+    
+    @circuit_breaker("euriai", "gpt-4.1-nano")
+    async def _a_try_euriai(self, prompt: str, temperature: float, max_tokens: int, timeout: int) -> APIResponse:
+        """Async Euriai call on the shared pool with timeout"""
+        if not self.euriai_llm:
+            return APIResponse(
+                success=False,
+                content="",
+                api_used="euriai",
+                response_time=0.0,
+                model="gpt-4.1-nano",
+                error="Euriai LangChain not available"
+            )
+        
+        start_ns = time.perf_counter_ns()
+        
+        try:
+            future = asyncio.wrap_future(self._executor.submit(self.euriai_llm.invoke, prompt))
+            result = await asyncio.wait_for(future, timeout=timeout)
+            return self._euriai_response(result, (time.perf_counter_ns() - start_ns) / 1e9)
             
-            if result and not result.startswith("Error:"):
-                return APIResponse(
-                    success=True,
-                    content=result,
-                    api_used="euriai",
-                    response_time=response_time,
-                    model="gpt-4.1-nano"
-                )
-            else:
-                return APIResponse(
-                    success=False,
-                    content="",
-                    api_used="euriai",
-                    response_time=response_time,
-                    model="gpt-4.1-nano",
-                    error="Invalid response from Euriai"
-                )
-                
+        except asyncio.TimeoutError:
+            return APIResponse(
+                success=False,
+                content="",
+                api_used="euriai",
+                response_time=(time.perf_counter_ns() - start_ns) / 1e9,
+                model="gpt-4.1-nano",
+                error=f"Timeout after {timeout}s",
+                error_kind="timeout"
+            )
         except Exception as e:
             return APIResponse(
                 success=False,
                 content="",
                 api_used="euriai",
-                response_time=time.time() - start_time,
+                response_time=(time.perf_counter_ns() - start_ns) / 1e9,
                 model="gpt-4.1-nano",
-                error=str(e)
+                error=str(e),
+                error_kind=_classify_error(str(e))
             )
     
+    def _euriai_response(self, result: Optional[str], response_time: float) -> APIResponse:
+        """Convert raw Euriai output to an APIResponse"""
+        if result and not result.startswith("Error:"):
+            return APIResponse(
+                success=True,
+                content=result,
+                api_used="euriai",
+                response_time=response_time,
+                model="gpt-4.1-nano"
+            )
+        return APIResponse(
+            success=False,
+            content="",
+            api_used="euriai",
+            response_time=response_time,
+            model="gpt-4.1-nano",
+            error="Invalid response from Euriai"
+        )
+    
+    @circuit_breaker("euri_client", "unknown")
     def _try_euri_client(self, messages: List[Dict[str, str]], temperature: float, max_tokens: int) -> APIResponse:
         """Try regular Euri client"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
-            response = euri_client.chat_completion(
+            response = euri_module.euri_client.chat_completion(
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens
             )
             
-            response_time = time.time() - start_time
-            
-            if response.success:
-                return APIResponse(
-                    success=True,
-                    content=response.content,
-                    api_used="euri_client",
-                    response_time=response_time,
-                    model=response.model
-                )
-            else:
-                return APIResponse(
-                    success=False,
-                    content="",
-                    api_used="euri_client",
-                    response_time=response_time,
-                    model="unknown",
-                    error=response.error
-                )
+            return self._euri_client_response(response, (time.perf_counter_ns() - start_ns) / 1e9)
+                
+        except Exception as e:
+            return APIResponse(
+                success=False,
+                content="",
+                api_used="euri_client",
+                response_time=(time.perf_counter_ns() - start_ns) / 1e9,
+                model="unknown",
+                error=str(e)
+            )
+    
+    @circuit_breaker("euri_client", "unknown")
+    async def _a_try_euri_client(self, messages: List[Dict[str, str]], temperature: float, max_tokens: int) -> APIResponse:
+        """Async regular Euri client call"""
+        start_ns = time.perf_counter_ns()
+        
+        try:
+            response = await euri_module.euri_client.achat_completion(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+            return self._euri_client_response(response, (time.perf_counter_ns() - start_ns) / 1e9)
                 
         except Exception as e:
             return APIResponse(
                 success=False,
                 content="",
                 api_used="euri_client",
-                response_time=time.time() - start_time,
+                response_time=(time.perf_counter_ns() - start_ns) / 1e9,
                 model="unknown",
                 error=str(e)
             )
     
+    def _euri_client_response(self, response, response_time: float) -> APIResponse:
+        """Convert an EuriResponse to an APIResponse"""
+        if response.success:
+            return APIResponse(
+                success=True,
+                content=response.content,
+                api_used="euri_client",
+                response_time=response_time,
+                model=response.model
+            )
+        return APIResponse(
+            success=False,
+            content="",
+            api_used="euri_client",
+            response_time=response_time,
+            model="unknown",
+            error=response.error
+        )
+    
+    @circuit_breaker("openai", settings.openai_model)
     def _try_openai(self, messages: List[Dict[str, str]], temperature: float, max_tokens: int, timeout: int) -> APIResponse:
         """Try OpenAI API"""
         if not self.openai_client:
@@ -276,74 +643,150 @@ class DualAPIClient:
                 error="OpenAI client not available"
             )
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
-            response = self.openai_client.chat.completions.create(
+            response = self._openai_for(timeout).chat.completions.create(
                 model=settings.openai_model,
                 messages=messages,
                 temperature=temperature,
-                max_tokens=max_tokens,
-                timeout=timeout
+                max_tokens=max_tokens
             )
             
-            response_time = time.time() - start_time
-            
-            if response.choices and response.choices[0].message:
-                return APIResponse(
-                    success=True,
-                    content=response.choices[0].message.content,
-                    api_used="openai",
-                    response_time=response_time,
-                    model=settings.openai_model,
-                    metadata={
-                        "usage": response.usage.model_dump() if response.usage else None,
-                        "finish_reason": response.choices[0].finish_reason
-                    }
-                )
-            else:
-                return APIResponse(
-                    success=False,
-                    content="",
-                    api_used="openai",
-                    response_time=response_time,
-                    model=settings.openai_model,
-                    error="No valid response from OpenAI"
-                )
+            return self._openai_response(response, (time.perf_counter_ns() - start_ns) / 1e9)
                 
         except Exception as e:
             return APIResponse(
                 success=False,
                 content="",
                 api_used="openai",
-                response_time=time.time() - start_time,
+                response_time=(time.perf_counter_ns() - start_ns) / 1e9,
                 model=settings.openai_model,
                 error=str(e)
             )
     
-    def _messages_to_prompt(self, messages: List[Dict[str, str]]) -> str:
-        """Convert messages format to single prompt"""
-        prompt_parts = []
+    @circuit_breaker("openai", settings.openai_model)
+    async def _a_try_openai(self, messages: List[Dict[str, str]], temperature: float, max_tokens: int, timeout: int) -> APIResponse:
+        """Async OpenAI API call"""
+        if not self.async_openai_client:
+            return APIResponse(
+                success=False,
+                content="",
+                api_used="openai",
+                response_time=0.0,
+                model=settings.openai_model,
+                error="OpenAI client not available"
+            )
         
+        start_ns = time.perf_counter_ns()
+        
+        try:
+            response = await self._async_openai_for(timeout).chat.completions.create(
+                model=settings.openai_model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+            return self._openai_response(response, (time.perf_counter_ns() - start_ns) / 1e9)
+                
+        except Exception as e:
+            return APIResponse(
+                success=False,
+                content="",
+                api_used="openai",
+                response_time=(time.perf_counter_ns() - start_ns) / 1e9,
+                model=settings.openai_model,
+                error=str(e)
+            )
+    
+    def _openai_for(self, timeout: float):
+        """OpenAI client configured with the given timeout, built once per value"""
+        client = self._openai_by_timeout.get(timeout)
+        if client is None:
+            client = self._openai_by_timeout[timeout] = self.openai_client.with_options(timeout=timeout)
+        return client
+    
+    def _async_openai_for(self, timeout: float):
+        """Async OpenAI client configured with the given timeout, built once per value"""
+        client = self._async_openai_by_timeout.get(timeout)
+        if client is None:
+            client = self._async_openai_by_timeout[timeout] = self.async_openai_client.with_options(timeout=timeout)
+        return client
+    
+    def _openai_response(self, response, response_time: float) -> APIResponse:
+        """Convert an OpenAI completion to an APIResponse"""
+        if response.choices and response.choices[0].message:
+            return APIResponse(
+                success=True,
+                content=response.choices[0].message.content,
+                api_used="openai",
+                response_time=response_time,
+                model=settings.openai_model,
+                metadata_factory=lambda: {
+                    "usage": response.usage.model_dump() if response.usage else None,
+                    "finish_reason": response.choices[0].finish_reason
+                }
+            )
+        return APIResponse(
+            success=False,
+            content="",
+            api_used="openai",
+            response_time=response_time,
+            model=settings.openai_model,
+            error="No valid response from OpenAI"
+        )
+    
+    def _messages_to_prompt(self, messages: List[Dict[str, str]]) -> str:
+        """Convert messages format to single prompt, reusing the longest cached conversation prefix"""
+        rolling = hashlib.blake2b(digest_size=16)
+        boundary_keys, contents = [], []
         for message in messages:
-            role = message.get("role", "user")
-            content = message.get("content", "")
-            
-            if role == "system":
-                prompt_parts.append(f"System: {content}")
-            elif role == "user":
-                prompt_parts.append(f"User: {content}")
-            elif role == "assistant":
-                prompt_parts.append(f"Assistant: {content}")
-        
-        return "\n\n".join(prompt_parts)
+            content = message.get("content") or ""
+            contents.append(content)
+            rolling.update(message.get("role", "user").encode())
+            rolling.update(b"\x00")
+            rolling.update(content.encode())
+            rolling.update(b"\x01")
+            boundary_keys.append(rolling.copy().digest())
+        
+        if not boundary_keys:
+            return ""
+        
+        # Find the longest already-rendered prefix of this conversation
+        head, start = "", 0
+        with self._prompt_cache_lock:
+            for i in range(len(boundary_keys) - 1, -1, -1):
+                cached = self._prompt_cache.get(boundary_keys[i])
+                if cached is not None:
+                    self._prompt_cache.move_to_end(boundary_keys[i])
+                    head, start = cached, i + 1
+                    break
+        
+        tail = "\n\n".join([
+            prefix + content
+            for message, content in zip(messages[start:], contents[start:])
+            if (prefix := _ROLE_PREFIX.get(message.get("role", "user"))) is not None
+        ])
+        prompt = f"{head}\n\n{tail}" if head and tail else head or tail
+        
+        with self._prompt_cache_lock:
+            self._prompt_cache[boundary_keys[-1]] = prompt
+            self._prompt_cache.move_to_end(boundary_keys[-1])
+            while len(self._prompt_cache) > PROMPT_CACHE_MAXSIZE:
+                self._prompt_cache.popitem(last=False)
+        return prompt
+    
+    async def aclose(self):
+        """Close the pooled async OpenAI transport"""
+        if self._openai_async_http is not None:
+            await self._openai_async_http.aclose()
     
     def get_status(self) -> Dict[str, Any]:
         """Get status of both APIs"""
         return {
             "euriai_available": bool(self.euriai_llm),
             "openai_available": bool(self.openai_client),
-            "euri_client_available": bool(euri_client),
+            "euri_client_available": bool(euri_module.euri_client),
             "primary_api": "euriai",
             "fallback_api": "openai"
         }
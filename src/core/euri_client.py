@@ -8,20 +8,42 @@ Version: 1.0.0
 """
 
 import asyncio
+import atexit
+import threading
 import time
-from typing import Dict, List, Optional, Union, Any
-from dataclasses import dataclass
+import hashlib
+import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from collections import OrderedDict
+from typing import Dict, List, Optional, Union, Any, AsyncIterator, Callable, Sequence, Tuple
+from dataclasses import dataclass, replace
 from enum import Enum
-import requests
 import httpx
+import numpy as np
 import os
 from dotenv import load_dotenv
 from loguru import logger
-import json
+import orjson
 
 # Load environment variables
 load_dotenv()
 
+# API key and request headers resolved once at import
+_API_KEY = os.getenv("EURI_API_KEY")
+
+
+def _build_headers(api_key: str) -> httpx.Headers:
+    """Request headers for an API key"""
+    return httpx.Headers({
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "User-Agent": "FinSolve-RBAC-Chatbot/1.0.0"
+    })
+
+
+_HEADERS = _build_headers(_API_KEY) if _API_KEY else None
+
 # Try to import Euriai LangChain components
 try:
     from euriai import EuriaiLangChainLLM
@@ -30,6 +52,35 @@ except ImportError:
     EURIAI_LANGCHAIN_AVAILABLE = False
     EuriaiLangChainLLM = None
 
+# HTTP/2 for pooled clients needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Successful deterministic (temperature 0) responses kept in memory
+RESPONSE_CACHE_MAXSIZE = 1024
+
+# Near-duplicate prompt cache: ring buffer size, similarity cut-off and default embedder
+SEMANTIC_CACHE_MAXSIZE = 1024
+SEMANTIC_CACHE_THRESHOLD = 0.92
+SEMANTIC_CACHE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Upper bound for the startup connection prewarm (seconds)
+PREWARM_TIMEOUT = 5.0
+
+# Retry backoff ceiling and the longest server-requested Retry-After we honor (seconds)
+RETRY_BACKOFF_CAP = 30.0
+RETRY_AFTER_MAX = 60.0
+
+# Keep-alive pool shared by every Euri API request
+EURI_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0
+)
+
 
 class EuriModel(Enum):
     """Available Euri models with their specifications"""
@@ -38,7 +89,7 @@ class EuriModel(Enum):
     GPT_3_5_TURBO = "gpt-3.5-turbo"
 
 
-@dataclass
+@dataclass(slots=True)
 class EuriResponse:
     """Structured response from Euri API"""
     content: str
@@ -49,7 +100,7 @@ class EuriResponse:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EuriMessage:
     """Message structure for Euri API"""
     role: str  # "system", "user", "assistant"
@@ -70,7 +121,7 @@ class EuriLangChainWrapper:
     """
 
     def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key or os.getenv("EURI_API_KEY")
+        self.api_key = api_key or _API_KEY
         self.langchain_llm = None
 
         if EURIAI_LANGCHAIN_AVAILABLE and self.api_key:
@@ -105,6 +156,68 @@ class EuriLangChainWrapper:
         return self.langchain_llm is not None
 
 
+class SemanticCache:
+    """
+    Second-tier response cache matching paraphrased prompts by cosine similarity.
+    Entries only match within the same scope digest (model, parameters and every
+    non-user message), so a cached answer is never served under a different role prompt.
+    """
+    
+    def __init__(
+        self,
+        embed: Optional[Callable[[str], Sequence[float]]] = None,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        maxsize: int = SEMANTIC_CACHE_MAXSIZE
+    ):
+        self._embed = embed
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._vectors: Optional[np.ndarray] = None
+        self._scopes = np.zeros(maxsize, dtype="S16")
+        self._responses: List[Optional[EuriResponse]] = [None] * maxsize
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()
+    
+    def _embedder(self) -> Callable[[str], Sequence[float]]:
+        """Default to a small local sentence-transformers model, loaded on first use"""
+        if self._embed is None:
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer(SEMANTIC_CACHE_MODEL)
+            self._embed = lambda text: model.encode(text, convert_to_numpy=True)
+        return self._embed
+    
+    def embed(self, text: str) -> np.ndarray:
+        """Unit-length float32 embedding of text"""
+        vector = np.asarray(self._embedder()(text), dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+    
+    def lookup(self, scope: bytes, vector: np.ndarray) -> Optional[EuriResponse]:
+        """Most similar cached response in scope, if it clears the threshold"""
+        with self._lock:
+            if not self._size:
+                return None
+            similarities = self._vectors[:self._size] @ vector
+            similarities[self._scopes[:self._size] != scope] = -1.0
+            best = int(similarities.argmax())
+            if similarities[best] < self.threshold:
+                return None
+            return self._responses[best]
+    
+    def add(self, scope: bytes, vector: np.ndarray, response: EuriResponse) -> None:
+        """Store a response, overwriting the oldest entry once full"""
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.maxsize, vector.shape[0]), dtype=np.float32)
+            slot = self._next
+            self._vectors[slot] = vector
+            self._scopes[slot] = scope
+            self._responses[slot] = response
+            self._next = (slot + 1) % self.maxsize
+            self._size = min(self._size + 1, self.maxsize)
+
+
 class EuriClient:
     """
     Production-grade Euri API client with comprehensive features:
@@ -124,49 +237,225 @@ class EuriClient:
         timeout: int = 60,  # Increased from 30 to 60 seconds
         max_retries: int = 2,  # Reduced retries to avoid long waits
         retry_delay: float = 2.0,  # Increased delay between retries
-        rate_limit_per_minute: int = 30  # Reduced rate limit to be more conservative
+        rate_limit_per_minute: int = 30,  # Reduced rate limit to be more conservative
+        enable_semantic_cache: bool = False,
+        semantic_cache_threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        embed_fn: Optional[Callable[[str], Sequence[float]]] = None
     ):
-        self.api_key = api_key or os.getenv("EURI_API_KEY")
+        self.api_key = api_key or _API_KEY
         self.base_url = base_url
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.rate_limit_per_minute = rate_limit_per_minute
         
-        # Rate limiting
-        self._request_times: List[float] = []
+        # Token-bucket rate limiting: refills rate_limit_per_minute tokens per minute
+        self._tokens: float = float(rate_limit_per_minute)
+        self._last_refill: float = time.monotonic()
+        self._rate_lock = threading.Lock()
+        
+        # LRU of successful temperature-0 responses keyed by payload digest
+        self._cache: "OrderedDict[bytes, EuriResponse]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+        # Deterministic async requests currently in flight, keyed like the cache
+        self._inflight: Dict[bytes, asyncio.Future] = {}
+        
+        # Optional near-duplicate tier consulted after an exact-cache miss
+        self._semantic_cache = (
+            SemanticCache(embed=embed_fn, threshold=semantic_cache_threshold)
+            if enable_semantic_cache else None
+        )
         
         # Validate API key
         if not self.api_key:
             raise EuriClientError("EURI_API_KEY not found in environment variables")
         
-        # Setup headers
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "FinSolve-RBAC-Chatbot/1.0.0"
-        }
+        # Setup headers, sharing the import-time instance for the default key
+        self.headers = _HEADERS if self.api_key == _API_KEY else _build_headers(self.api_key)
+        
+        # Long-lived pooled clients so warm calls skip TCP/TLS setup; only the
+        # async client multiplexes over HTTP/2, sync calls never overlap per thread
+        self._sync = httpx.Client(
+            headers=self.headers,
+            timeout=self.timeout,
+            limits=EURI_HTTP_LIMITS
+        )
+        self._async = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            limits=EURI_HTTP_LIMITS,
+            http2=HTTP2_AVAILABLE
+        )
+        atexit.register(self.close)
         
         logger.info("Euri client initialized successfully")
     
-    def _check_rate_limit(self) -> None:
-        """Check and enforce rate limiting"""
-        current_time = time.time()
-        
-        # Remove requests older than 1 minute
-        self._request_times = [
-            req_time for req_time in self._request_times 
-            if current_time - req_time < 60
-        ]
+    def prewarm(self) -> None:
+        """Open a pooled keep-alive connection on the sync client"""
+        try:
+            self._sync.head(self.base_url, timeout=PREWARM_TIMEOUT)
+        except httpx.HTTPError as e:
+            logger.debug(f"Euri sync prewarm failed: {str(e)}")
+    
+    async def aprewarm(self) -> None:
+        """Open pooled connections on both clients so the first request skips TCP/TLS setup"""
+        async def prewarm_async():
+            try:
+                await self._async.head(self.base_url, timeout=PREWARM_TIMEOUT)
+            except httpx.HTTPError as e:
+                logger.debug(f"Euri async prewarm failed: {str(e)}")
         
-        # Check if we're hitting rate limit
-        if len(self._request_times) >= self.rate_limit_per_minute:
-            sleep_time = 60 - (current_time - self._request_times[0])
-            if sleep_time > 0:
-                logger.warning(f"Rate limit reached. Sleeping for {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
+        await asyncio.gather(prewarm_async(), asyncio.to_thread(self.prewarm))
+        logger.info("Euri API connections prewarmed")
+    
+    def close(self) -> None:
+        """Close the pooled sync HTTP client"""
+        self._sync.close()
+    
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP client"""
+        await self._async.aclose()
+    
+    def _cache_key(self, payload: Dict[str, Any], body: bytes) -> Optional[bytes]:
+        """Digest of a deterministic request body, or None when it should not be cached"""
+        if payload["temperature"] != 0:
+            return None
+        return hashlib.blake2b(body, digest_size=16).digest()
+    
+    def _get_cached(self, key: Optional[bytes]) -> Optional[EuriResponse]:
+        """Return a cached response, refreshing its LRU position"""
+        if key is None:
+            return None
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                self._cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._cache_hits += 1
+        return replace(cached, response_time=0.0)
+    
+    def _store_cached(self, key: Optional[bytes], response: EuriResponse) -> None:
+        """Cache a successful response, evicting the least recently used"""
+        if key is None:
+            return
+        with self._cache_lock:
+            self._cache[key] = response
+            self._cache.move_to_end(key)
+            while len(self._cache) > RESPONSE_CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
+    
+    def _semantic_query(self, payload: Dict[str, Any]) -> Optional[Tuple[bytes, str]]:
+        """Scope digest and user text for the semantic tier, or None when it does not apply"""
+        user_text = "\n".join(
+            message.get("content", "") for message in payload["messages"] if message.get("role") == "user"
+        )
+        if not user_text:
+            return None
+        scope_payload = {
+            **payload,
+            "messages": [message for message in payload["messages"] if message.get("role") != "user"]
+        }
+        scope = hashlib.blake2b(orjson.dumps(scope_payload, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+        return scope, user_text
+    
+    def _semantic_lookup(self, payload: Dict[str, Any]) -> Tuple[Optional[EuriResponse], Optional[Tuple[bytes, np.ndarray]]]:
+        """Check the semantic tier; returns a hit or the (scope, vector) to store after a miss"""
+        query = self._semantic_query(payload)
+        if query is None:
+            return None, None
+        scope, user_text = query
+        vector = self._semantic_cache.embed(user_text)
+        cached = self._semantic_cache.lookup(scope, vector)
+        if cached is not None:
+            with self._cache_lock:
+                self._cache_hits += 1
+            return replace(cached, response_time=0.0), None
+        return None, (scope, vector)
+    
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """Response cache hit/miss counters"""
+        with self._cache_lock:
+            return {"hits": self._cache_hits, "misses": self._cache_misses, "size": len(self._cache)}
+    
+    def cache_clear(self) -> None:
+        """Drop all cached responses"""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _reserve_token(self) -> float:
+        """Take a token from the bucket and return how long to wait before using it"""
+        capacity = float(self.rate_limit_per_minute)
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(capacity, self._tokens + (now - self._last_refill) * capacity / 60)
+            self._last_refill = now
+            
+            # A negative balance reserves a future token for this caller
+            wait = (1 - self._tokens) * 60 / capacity if self._tokens < 1 else 0.0
+            self._tokens -= 1
         
-        self._request_times.append(current_time)
+        if wait > 0:
+            logger.warning(f"Rate limit reached. Waiting {wait:.2f} seconds")
+        return wait
+    
+    def _check_rate_limit_sync(self) -> None:
+        """Enforce the rate limit, blocking the calling thread"""
+        wait = self._reserve_token()
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def _acheck_rate_limit(self) -> None:
+        """Enforce the rate limit without blocking the event loop"""
+        wait = self._reserve_token()
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    @staticmethod
+    def _is_retryable(error: httpx.HTTPError) -> bool:
+        """Retry transport errors, 429s and 5xx responses; other 4xx fail fast"""
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+            return status_code == 429 or status_code >= 500
+        return True
+    
+    def _retry_wait(self, attempt: int, error: httpx.HTTPError) -> float:
+        """Seconds before the next attempt: the server's Retry-After on 429, else jittered backoff"""
+        if isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429:
+            retry_after = error.response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(max(float(retry_after), 0.0), RETRY_AFTER_MAX)
+                except ValueError:
+                    try:
+                        delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                        return min(max(delay, 0.0), RETRY_AFTER_MAX)
+                    except (TypeError, ValueError):
+                        pass
+        return min(RETRY_BACKOFF_CAP, self.retry_delay * (2 ** attempt)) * random.uniform(0.5, 1.5)
+    
+    @staticmethod
+    def _parse_completion(raw: bytes) -> Tuple[str, Dict[str, int]]:
+        """Extract content and usage from a completion body, validating by direct access"""
+        response_data = orjson.loads(raw)
+        try:
+            content = response_data["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError) as e:
+            raise EuriClientError("Invalid response format: missing choices") from e
+        return content, response_data.get("usage") or {}
+    
+    @staticmethod
+    def _format_message(msg: Union[EuriMessage, Dict[str, str]]) -> Dict[str, str]:
+        """Convert one message to the API dict format"""
+        if isinstance(msg, dict):
+            return msg
+        if isinstance(msg, EuriMessage):
+            return {"role": msg.role, "content": msg.content}
+        raise EuriClientError(f"Invalid message type: {type(msg)}")
     
     def _prepare_payload(
         self,
@@ -178,15 +467,11 @@ class EuriClient:
     ) -> Dict[str, Any]:
         """Prepare API request payload"""
         
-        # Convert messages to proper format
-        formatted_messages = []
-        for msg in messages:
-            if isinstance(msg, EuriMessage):
-                formatted_messages.append(msg.to_dict())
-            elif isinstance(msg, dict):
-                formatted_messages.append(msg)
-            else:
-                raise EuriClientError(f"Invalid message type: {type(msg)}")
+        # Plain dict messages (the common case) are sent as-is
+        if type(messages) is list and all(type(msg) is dict for msg in messages):
+            formatted_messages = messages
+        else:
+            formatted_messages = [self._format_message(msg) for msg in messages]
         
         # Handle model enum
         model_str = model.value if isinstance(model, EuriModel) else model
@@ -223,49 +508,58 @@ class EuriClient:
             EuriResponse object with completion data
         """
         start_time = time.time()
+        payload: Dict[str, Any] = {}
         
         try:
-            self._check_rate_limit()
             payload = self._prepare_payload(messages, model, temperature, max_tokens, **kwargs)
+            # Serialized once (sorted, so it doubles as the cache key) and reused by every attempt
+            body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+            cache_key = self._cache_key(payload, body)
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+            
+            semantic_entry = None
+            if cache_key is not None and self._semantic_cache is not None:
+                cached, semantic_entry = self._semantic_lookup(payload)
+                if cached is not None:
+                    return cached
+            
+            self._check_rate_limit_sync()
             
-            for attempt in range(self.max_retries + 1):
+            # Loop-invariant attributes bound to locals
+            post, url, max_retries = self._sync.post, self.base_url, self.max_retries
+            
+            for attempt in range(max_retries + 1):
                 try:
                     logger.debug(f"Making API request (attempt {attempt + 1})")
                     
-                    response = requests.post(
-                        self.base_url,
-                        headers=self.headers,
-                        json=payload,
-                        timeout=self.timeout
-                    )
+                    response = post(url, content=body)
                     response.raise_for_status()
                     
-                    response_data = response.json()
+                    content, usage = self._parse_completion(response.content)
                     response_time = time.time() - start_time
                     
-                    # Validate response structure
-                    if "choices" not in response_data or not response_data["choices"]:
-                        raise EuriClientError("Invalid response format: missing choices")
-                    
-                    content = response_data["choices"][0]["message"]["content"]
-                    usage = response_data.get("usage", {})
-                    
                     logger.info(f"API request successful in {response_time:.2f}s")
                     
-                    return EuriResponse(
+                    result = EuriResponse(
                         content=content,
                         model=payload["model"],
                         usage=usage,
                         response_time=response_time,
                         success=True
                     )
+                    self._store_cached(cache_key, result)
+                    if semantic_entry is not None:
+                        self._semantic_cache.add(*semantic_entry, result)
+                    return result
                     
-                except requests.exceptions.RequestException as e:
-                    if attempt == self.max_retries:
-                        raise EuriClientError(f"API request failed after {self.max_retries + 1} attempts: {str(e)}")
+                except httpx.HTTPError as e:
+                    if attempt == max_retries or not self._is_retryable(e):
+                        raise EuriClientError(f"API request failed after {attempt + 1} attempts: {str(e)}")
                     
-                    wait_time = self.retry_delay * (2 ** attempt)
-                    logger.warning(f"Request failed (attempt {attempt + 1}), retrying in {wait_time}s: {str(e)}")
+                    wait_time = self._retry_wait(attempt, e)
+                    logger.warning(f"Request failed (attempt {attempt + 1}), retrying in {wait_time:.2f}s: {str(e)}")
                     time.sleep(wait_time)
                     
         except Exception as e:
@@ -293,50 +587,41 @@ class EuriClient:
         Asynchronous chat completion with retry logic
         """
         start_time = time.time()
+        payload: Dict[str, Any] = {}
         
         try:
-            self._check_rate_limit()
             payload = self._prepare_payload(messages, model, temperature, max_tokens, **kwargs)
+            # Serialized once (sorted, so it doubles as the cache key) and reused by every attempt
+            body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+            cache_key = self._cache_key(payload, body)
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+            
+            if cache_key is None:
+                return await self._afetch(payload, body, cache_key, start_time)
+            
+            # Concurrent identical deterministic requests share one upstream call
+            inflight = self._inflight.get(cache_key)
+            if inflight is not None:
+                return await asyncio.shield(inflight)
+            inflight = self._inflight[cache_key] = asyncio.get_running_loop().create_future()
+            try:
+                result = await self._afetch(payload, body, cache_key, start_time)
+            except asyncio.CancelledError:
+                inflight.set_exception(EuriClientError("Coalesced request was cancelled"))
+                inflight.exception()
+                raise
+            except Exception as e:
+                inflight.set_exception(e)
+                inflight.exception()
+                raise
+            else:
+                inflight.set_result(result)
+                return result
+            finally:
+                self._inflight.pop(cache_key, None)
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                for attempt in range(self.max_retries + 1):
-                    try:
-                        logger.debug(f"Making async API request (attempt {attempt + 1})")
-                        
-                        response = await client.post(
-                            self.base_url,
-                            headers=self.headers,
-                            json=payload
-                        )
-                        response.raise_for_status()
-                        
-                        response_data = response.json()
-                        response_time = time.time() - start_time
-                        
-                        if "choices" not in response_data or not response_data["choices"]:
-                            raise EuriClientError("Invalid response format: missing choices")
-                        
-                        content = response_data["choices"][0]["message"]["content"]
-                        usage = response_data.get("usage", {})
-                        
-                        logger.info(f"Async API request successful in {response_time:.2f}s")
-                        
-                        return EuriResponse(
-                            content=content,
-                            model=payload["model"],
-                            usage=usage,
-                            response_time=response_time,
-                            success=True
-                        )
-                        
-                    except httpx.RequestError as e:
-                        if attempt == self.max_retries:
-                            raise EuriClientError(f"Async API request failed after {self.max_retries + 1} attempts: {str(e)}")
-                        
-                        wait_time = self.retry_delay * (2 ** attempt)
-                        logger.warning(f"Async request failed (attempt {attempt + 1}), retrying in {wait_time}s: {str(e)}")
-                        await asyncio.sleep(wait_time)
-                        
         except Exception as e:
             response_time = time.time() - start_time
             logger.error(f"Async chat completion failed: {str(e)}")
@@ -350,6 +635,115 @@ class EuriClient:
                 error=str(e)
             )
     
+    async def _afetch(
+        self,
+        payload: Dict[str, Any],
+        body: bytes,
+        cache_key: Optional[bytes],
+        start_time: float
+    ) -> EuriResponse:
+        """Semantic-cache check, rate limiting and retried POST for one async completion"""
+        semantic_entry = None
+        if cache_key is not None and self._semantic_cache is not None:
+            cached, semantic_entry = await asyncio.to_thread(self._semantic_lookup, payload)
+            if cached is not None:
+                return cached
+        
+        await self._acheck_rate_limit()
+        
+        # Loop-invariant attributes bound to locals
+        post, url, max_retries = self._async.post, self.base_url, self.max_retries
+        
+        for attempt in range(max_retries + 1):
+            try:
+                logger.debug(f"Making async API request (attempt {attempt + 1})")
+                
+                response = await post(url, content=body)
+                response.raise_for_status()
+                
+                content, usage = self._parse_completion(response.content)
+                response_time = time.time() - start_time
+                
+                logger.info(f"Async API request successful in {response_time:.2f}s")
+                
+                result = EuriResponse(
+                    content=content,
+                    model=payload["model"],
+                    usage=usage,
+                    response_time=response_time,
+                    success=True
+                )
+                self._store_cached(cache_key, result)
+                if semantic_entry is not None:
+                    self._semantic_cache.add(*semantic_entry, result)
+                return result
+                
+            except httpx.HTTPError as e:
+                if attempt == max_retries or not self._is_retryable(e):
+                    raise EuriClientError(f"Async API request failed after {attempt + 1} attempts: {str(e)}")
+                
+                wait_time = self._retry_wait(attempt, e)
+                logger.warning(f"Async request failed (attempt {attempt + 1}), retrying in {wait_time:.2f}s: {str(e)}")
+                await asyncio.sleep(wait_time)
+    
+    async def astream_completion(
+        self,
+        messages: List[Union[EuriMessage, Dict[str, str]]],
+        model: Union[EuriModel, str] = EuriModel.GPT_4_1_NANO,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion, yielding content deltas as server-sent events arrive
+        
+        Raises:
+            EuriClientError: if the request fails or the stream is malformed
+        """
+        payload = self._prepare_payload(messages, model, temperature, max_tokens, stream=True, **kwargs)
+        await self._acheck_rate_limit()
+        
+        try:
+            async with self._async.stream("POST", self.base_url, content=orjson.dumps(payload)) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    data = line[6:]
+                    if data == "[DONE]":
+                        break
+                    choices = orjson.loads(data).get("choices")
+                    if choices:
+                        delta = choices[0].get("delta", {}).get("content")
+                        if delta:
+                            yield delta
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.error(f"Streaming chat completion failed: {str(e)}")
+            raise EuriClientError(f"Streaming request failed: {str(e)}") from e
+    
+    async def abatch_completion(
+        self,
+        batches: List[List[Union[EuriMessage, Dict[str, str]]]],
+        model: Union[EuriModel, str] = EuriModel.GPT_4_1_NANO,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        concurrency: Optional[int] = None,
+        **kwargs
+    ) -> List[Union[EuriResponse, BaseException]]:
+        """
+        Run several chat completions concurrently, in input order
+        
+        Concurrency defaults to the keep-alive pool size; every request still
+        goes through the shared token bucket, so the rate limit holds.
+        """
+        semaphore = asyncio.Semaphore(concurrency or EURI_HTTP_LIMITS.max_keepalive_connections)
+        
+        async def one(messages):
+            async with semaphore:
+                return await self.achat_completion(messages, model, temperature, max_tokens, **kwargs)
+        
+        return await asyncio.gather(*(one(messages) for messages in batches), return_exceptions=True)
+    
     def create_message(self, role: str, content: str) -> EuriMessage:
         """Helper method to create properly formatted messages"""
         return EuriMessage(role=role, content=content)
@@ -367,9 +761,32 @@ class EuriClient:
         return EuriMessage(role="assistant", content=content)
 
 
-# Global client instances
-euri_client = EuriClient()
-euri_langchain = EuriLangChainWrapper()
+# Global client instances, built on first access so importing this module does no setup
+_SINGLETON_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "euri_client": lambda: EuriClient(
+        enable_semantic_cache=os.getenv("EURI_SEMANTIC_CACHE", "").lower() in ("1", "true")
+    ),
+    "euri_langchain": EuriLangChainWrapper
+}
+_singletons_lock = threading.Lock()
+
+
+def _get_singleton(name: str) -> Any:
+    """Construct and cache a global instance once"""
+    instance = globals().get(name)
+    if instance is None:
+        with _singletons_lock:
+            instance = globals().get(name)
+            if instance is None:
+                instance = globals()[name] = _SINGLETON_FACTORIES[name]()
+    return instance
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily provide euri_client / euri_langchain (PEP 562)"""
+    if name in _SINGLETON_FACTORIES:
+        return _get_singleton(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Convenience functions for backward compatibility
@@ -383,7 +800,7 @@ def euri_chat_completion(
     Legacy function for backward compatibility
     Returns only the content string
     """
-    response = euri_client.chat_completion(messages, model, temperature, max_tokens)
+    response = _get_singleton("euri_client").chat_completion(messages, model, temperature, max_tokens)
     if not response.success:
         raise EuriClientError(response.error or "Unknown error occurred")
     return response.content
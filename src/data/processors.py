@@ -8,24 +8,102 @@ Version: 1.0.0
 """
 
 import os
+import numpy as np
 import pandas as pd
 import json
 import gc
+import mmap
 import sys
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Mapping, Callable
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 import re
 from datetime import datetime
-from functools import lru_cache
+from collections import OrderedDict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
 import hashlib
+import importlib.util
 import pickle
 from loguru import logger
+try:
+    from blake3 import blake3 as _file_hasher
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    _file_hasher = hashlib.blake2b
+    BLAKE3_AVAILABLE = False
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
 
 from ..core.config import settings, UserRole, ROLE_PERMISSIONS
 
 
+# File extensions cataloged as data sources
+SUPPORTED_EXTENSIONS = frozenset({".csv", ".md", ".json", ".txt"})
+
+# Upper bound on concurrent department scans at startup
+SCAN_MAX_WORKERS = 8
+
+# Read size for incremental file hashing
+HASH_CHUNK_SIZE = 1 << 20
+
+# Disk cache key for the {path: (mtime_ns, size, hash)} index
+HASH_INDEX_CACHE_KEY = "hash_index"
+
+# Disk cache key for the per-file inverted text indexes
+TEXT_INDEX_CACHE_KEY = "inv_index"
+
+# Open file mappings kept for text search; evicted mappings are closed
+MMAP_CACHE_MAXSIZE = 64
+
+# Word tokens recorded in the inverted text index
+_TOKEN_RE = re.compile(r"\w+")
+
+# Line breaks in decoded text, for non-ASCII searches
+_NEWLINE_RE = re.compile("\n")
+
+# Salary bands shown to roles that may not see exact amounts (lower bound inclusive)
+SALARY_BINS = [-np.inf, 500000, 1000000, 1500000, 2000000, np.inf]
+SALARY_LABELS = ["Below 5L", "5L - 10L", "10L - 15L", "15L - 20L", "Above 20L"]
+
+# Columns non-HR roles may see in HR department CSVs
+HR_BASIC_COLUMNS = ("employee_id", "full_name", "role", "department", "email")
+
+# Maximum rows returned by a CSV query
+CSV_ROW_LIMIT = 1000
+
+# Parsed CSV frames (with per-role views) kept in memory; entries are shared and never mutated
+CSV_CACHE_MAXSIZE = 32
+
+# Multithreaded pyarrow CSV parser when installed, pandas' C parser otherwise
+CSV_ENGINE = "pyarrow" if PYARROW_AVAILABLE else "c"
+
+# Value kinds pyarrow infers that the C parser keeps as strings
+ARROW_TEMPORAL_KINDS = frozenset({"date", "datetime", "datetime64", "time"})
+
+# Low-cardinality columns parsed as categoricals, keyed by file name
+CSV_SCHEMA_HINTS = {
+    "hr_data.csv": {
+        "department": "category",
+        "role": "category",
+        "gender": "category",
+        "location": "category",
+    },
+}
+
+
+def _scandir_recursive(path: Union[str, Path]):
+    """Yield file DirEntry objects under path, reusing scandir's cached stat data"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
 class DataType(Enum):
     """Data types supported by the system"""
     CSV = "csv"
@@ -43,6 +121,96 @@ class Department(Enum):
     GENERAL = "general"
 
 
+def _frozen_metadata(metadata: Dict[str, Any]) -> Mapping[str, Any]:
+    """Freeze a metadata template with its categorical strings interned"""
+    return MappingProxyType({
+        key: [sys.intern(item) for item in value] if isinstance(value, list) else sys.intern(value)
+        for key, value in metadata.items()
+    })
+
+
+# Engineering Data
+_ENGINEERING_METADATA = _frozen_metadata({
+    "description": "FinSolve's complete technical architecture and engineering processes",
+    "purpose": "Documents technical architecture, microservices, CI/CD pipelines, security models, and compliance (GDPR, DPDP, PCI-DSS)",
+    "ownership": "Engineering Team",
+    "update_frequency": "Updated quarterly",
+    "sensitivity_level": "High - restricted to Engineering Team and C-Level Executives",
+    "usage_context": ["audits", "onboarding", "scaling", "system maintenance", "compliance"],
+    "content_summary": "Covers development standards, DevOps practices, monitoring, and future tech roadmap (AI, blockchain)",
+    "key_topics": ["microservices", "CI/CD", "security", "compliance", "GDPR", "DPDP", "PCI-DSS", "DevOps", "monitoring", "AI", "blockchain"]
+})
+
+# Finance Department Data
+_FINANCE_METADATA = _frozen_metadata({
+    "description": "FinSolve's quarterly financial performance for the year 2024",
+    "purpose": "Documents quarterly financial performance including revenue, income, gross margin, marketing spend, vendor costs, and cash flow data",
+    "ownership": "Finance Team",
+    "update_frequency": "Updated quarterly",
+    "sensitivity_level": "High - restricted to Finance Team and C-Level Executives",
+    "usage_context": ["financial planning", "audits", "investor reporting", "strategic decisions"],
+    "content_summary": "Provides detailed expense breakdowns and risk mitigation strategies for each quarter",
+    "key_topics": ["revenue", "income", "gross margin", "marketing spend", "vendor costs", "cash flow", "expenses", "risk mitigation"]
+})
+
+# Employee Handbook
+_HANDBOOK_METADATA = _frozen_metadata({
+    "description": "Comprehensive company policies covering all aspects of employment",
+    "purpose": "Serves as the authoritative guide for employees on company vision, values, HR processes, legal compliance, and workplace standards",
+    "ownership": "Human Resources Department",
+    "update_frequency": "Reviewed and updated annually or as regulations and company practices change",
+    "sensitivity_level": "Medium - accessible to all employees",
+    "usage_context": ["new-hire orientation", "policy clarifications", "leave & attendance management", "performance reviews", "exit procedures"],
+    "content_summary": "Covers onboarding & benefits, leave policies, work hours & attendance, code of conduct & workplace behavior, health & safety, compensation & payroll, reimbursement, training & development, performance & feedback, privacy & data security, exit procedures, FAQs",
+    "key_topics": ["onboarding", "benefits", "leave policies", "attendance", "code of conduct", "health & safety", "compensation", "payroll", "training", "performance", "privacy", "data security"]
+})
+
+# HR Data
+_HR_METADATA = _frozen_metadata({
+    "description": "HR's employee dataset covering 100 records with comprehensive employee information",
+    "purpose": "Documents HR's employee dataset with demographics, employment, compensation, leave, attendance, and performance fields",
+    "ownership": "HR & People Analytics team",
+    "update_frequency": "Refreshed monthly to capture hires, exits, and updates",
+    "sensitivity_level": "High - restricted to HR and C-Level Executives",
+    "usage_context": ["talent forecasting", "compensation reviews", "compliance reporting", "employee engagement initiatives"],
+    "content_summary": "Provides workforce composition insights, turnover tracking, leave utilization, and performance trend analysis",
+    "key_topics": ["demographics", "employment", "compensation", "leave", "attendance", "performance", "workforce composition", "turnover", "engagement"]
+})
+
+# Marketing Department
+_MARKETING_METADATA = _frozen_metadata({
+    "description": "Marketing department data including campaign overviews and performance metrics",
+    "purpose": "Includes campaign overviews, spend allocations, customer acquisition targets, revenue projections, conversion and ROI benchmarks",
+    "ownership": "Marketing Team",
+    "update_frequency": "Refreshed quarterly",
+    "sensitivity_level": "Medium - restricted to Marketing Team and C-Level Executives",
+    "usage_context": ["quarterly planning", "budget allocation", "performance reviews", "Q1 2025 strategy recommendations"],
+    "content_summary": "Provides detailed highlights on digital marketing, B2B initiatives, customer retention programs, and preliminary performance analysis",
+    "key_topics": ["campaigns", "spend allocation", "customer acquisition", "revenue projections", "conversion", "ROI", "digital marketing", "B2B", "customer retention"]
+})
+
+# Default/General
+_GENERAL_METADATA = _frozen_metadata({
+    "description": "Data file",
+    "purpose": "General company data and documentation",
+    "ownership": "Various departments",
+    "update_frequency": "As needed",
+    "sensitivity_level": "Medium",
+    "usage_context": ["general reference", "documentation"],
+    "content_summary": "General content",
+    "key_topics": ["general", "documentation"]
+})
+
+# (department, filename pattern, template) checked in order; first match wins
+_METADATA_DISPATCH = (
+    (Department.ENGINEERING, re.compile(r"engineering|technical"), _ENGINEERING_METADATA),
+    (Department.FINANCE, re.compile(r"financial|finance"), _FINANCE_METADATA),
+    (None, re.compile(r"handbook|employee"), _HANDBOOK_METADATA),
+    (Department.HR, re.compile(r"hr"), _HR_METADATA),
+    (Department.MARKETING, re.compile(r"marketing|campaign"), _MARKETING_METADATA),
+)
+
+
 @dataclass
 class DataSource:
     """Enhanced data source metadata with comprehensive information"""
@@ -66,15 +234,21 @@ class DataSource:
     file_hash: str = ""
 
     def __post_init__(self):
-        """Generate file hash for caching and change detection"""
+        """Intern categorical fields and generate file hash for change detection"""
+        self.ownership = sys.intern(self.ownership)
+        self.update_frequency = sys.intern(self.update_frequency)
+        self.sensitivity_level = sys.intern(self.sensitivity_level)
         if not self.file_hash and os.path.exists(self.path):
             self.file_hash = self._calculate_file_hash()
 
     def _calculate_file_hash(self) -> str:
-        """Calculate MD5 hash of file content for change detection"""
+        """Calculate BLAKE3 hash of file content for change detection"""
         try:
+            hasher = _file_hasher()
             with open(self.path, 'rb') as f:
-                return hashlib.md5(f.read()).hexdigest()
+                while chunk := f.read(HASH_CHUNK_SIZE):
+                    hasher.update(chunk)
+            return hasher.hexdigest()
         except Exception:
             return ""
 
@@ -102,6 +276,28 @@ class DataProcessor:
         self.cache_directory = Path(settings.data_directory) / ".cache"
         self.cache_directory.mkdir(exist_ok=True)
 
+        # Short-lived per-role data summary cache
+        self._summary_cache: TTLCache = TTLCache(maxsize=16, ttl=30)
+        self._summary_lock = threading.Lock()
+
+        # LRU of parsed CSV frames and their per-role views keyed by (path, mtime_ns, size)
+        self._csv_cache: "OrderedDict[Tuple[str, int, int], Tuple[pd.DataFrame, Dict[UserRole, pd.DataFrame]]]" = OrderedDict()
+        self._csv_cache_lock = threading.Lock()
+
+        # LRU of read-only file mappings keyed by (path, mtime_ns, size)
+        self._mmap_cache: "OrderedDict[Tuple[str, int, int], Tuple[mmap.mmap, np.ndarray]]" = OrderedDict()
+        self._mmap_cache_lock = threading.Lock()
+        self._mmap_hits = 0
+        self._mmap_misses = 0
+
+        # Per-file token -> line numbers indexes, reused while the file hash is unchanged
+        self._text_index: Dict[str, Tuple[Tuple[int, int], Dict[str, List[int]]]] = self._load_cache(TEXT_INDEX_CACHE_KEY) or {}
+        self._text_index_lock = threading.Lock()
+
+        # File hashes from the previous run, reused while (mtime, size) is unchanged
+        self._hash_index: Dict[str, Tuple[int, int, str]] = self._load_cache(HASH_INDEX_CACHE_KEY) or {}
+        self._hash_index_lock = threading.Lock()
+
         # Initialize with caching
         self._initialize_data_sources()
 
@@ -114,24 +310,42 @@ class DataProcessor:
             logger.warning(f"Data directory not found: {self.data_directory}")
             return
         
-        # Scan each department directory
-        for dept_dir in self.data_directory.iterdir():
-            if dept_dir.is_dir() and dept_dir.name in [d.value for d in Department]:
-                department = Department(dept_dir.name)
-                self._scan_department_data(department, dept_dir)
+        # Scan department directories in parallel; stat and hashing are I/O-bound
+        departments = [
+            (Department(dept_dir.name), dept_dir)
+            for dept_dir in self.data_directory.iterdir()
+            if dept_dir.is_dir() and dept_dir.name in [d.value for d in Department]
+        ]
+        if departments:
+            with ThreadPoolExecutor(
+                max_workers=min(SCAN_MAX_WORKERS, len(departments)),
+                thread_name_prefix="data-scan"
+            ) as executor:
+                for sources in executor.map(lambda d: self._scan_department_data(*d), departments):
+                    self.data_sources.update(sources)
+        
+        self._save_hash_index()
         
         logger.info(f"Cataloged {len(self.data_sources)} data sources")
     
-    def _scan_department_data(self, department: Department, dept_path: Path):
+    def _scan_department_data(self, department: Department, dept_path: Path) -> Dict[str, DataSource]:
         """Scan data files in a department directory"""
-        for file_path in dept_path.rglob("*"):
-            if file_path.is_file() and file_path.suffix in [".csv", ".md", ".json", ".txt"]:
+        sources: Dict[str, DataSource] = {}
+        for entry in _scandir_recursive(dept_path):
+            extension = os.path.splitext(entry.name)[1]
+            if extension in SUPPORTED_EXTENSIONS:
+                file_path = Path(entry.path)
                 try:
                     # Determine data type
                     data_type = self._get_data_type(file_path)
                     
-                    # Get file stats
-                    stat = file_path.stat()
+                    # Get file stats (cached on the DirEntry)
+                    stat = entry.stat()
+                    
+                    # Skip hashing when the file is unchanged since the last run
+                    with self._hash_index_lock:
+                        cached = self._hash_index.get(entry.path)
+                    file_hash = cached[2] if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size) else ""
                     
                     # Determine access roles based on department
                     access_roles = self._get_access_roles(department)
@@ -142,7 +356,7 @@ class DataProcessor:
                     # Create data source
                     source = DataSource(
                         name=file_path.stem,
-                        path=str(file_path),
+                        path=entry.path,
                         department=department,
                         data_type=data_type,
                         description=metadata["description"],
@@ -155,13 +369,29 @@ class DataProcessor:
                         sensitivity_level=metadata["sensitivity_level"],
                         usage_context=metadata["usage_context"],
                         content_summary=metadata["content_summary"],
-                        key_topics=metadata["key_topics"]
+                        key_topics=metadata["key_topics"],
+                        file_hash=file_hash
                     )
                     
-                    self.data_sources[f"{department.value}_{file_path.stem}"] = source
+                    if source.file_hash != file_hash:
+                        with self._hash_index_lock:
+                            self._hash_index[entry.path] = (stat.st_mtime_ns, stat.st_size, source.file_hash)
+                    
+                    sources[f"{department.value}_{file_path.stem}"] = source
                     
                 except Exception as e:
-                    logger.warning(f"Failed to catalog file {file_path}: {str(e)}")
+                    logger.warning(f"Failed to catalog file {entry.path}: {str(e)}")
+        
+        return sources
+    
+    def _save_hash_index(self) -> None:
+        """Persist file hashes for cataloged sources, dropping removed files"""
+        with self._hash_index_lock:
+            paths = {source.path for source in self.data_sources.values()}
+            self._hash_index = {
+                path: entry for path, entry in self._hash_index.items() if path in paths
+            }
+            self._save_cache(HASH_INDEX_CACHE_KEY, self._hash_index)
     
     def _get_data_type(self, file_path: Path) -> DataType:
         """Determine data type from file extension"""
@@ -192,87 +422,20 @@ class DataProcessor:
         
         return access_roles
     
-    def _generate_comprehensive_metadata(self, file_path: Path, department: Department) -> Dict[str, Any]:
+    def _generate_comprehensive_metadata(self, file_path: Path, department: Department) -> Mapping[str, Any]:
         """Generate comprehensive metadata based on your specifications"""
         name = file_path.stem.lower()
-
-        # Engineering Data
-        if department == Department.ENGINEERING or "engineering" in name or "technical" in name:
-            return {
-                "description": "FinSolve's complete technical architecture and engineering processes",
-                "purpose": "Documents technical architecture, microservices, CI/CD pipelines, security models, and compliance (GDPR, DPDP, PCI-DSS)",
-                "ownership": "Engineering Team",
-                "update_frequency": "Updated quarterly",
-                "sensitivity_level": "High - restricted to Engineering Team and C-Level Executives",
-                "usage_context": ["audits", "onboarding", "scaling", "system maintenance", "compliance"],
-                "content_summary": "Covers development standards, DevOps practices, monitoring, and future tech roadmap (AI, blockchain)",
-                "key_topics": ["microservices", "CI/CD", "security", "compliance", "GDPR", "DPDP", "PCI-DSS", "DevOps", "monitoring", "AI", "blockchain"]
-            }
-
-        # Finance Department Data
-        elif department == Department.FINANCE or "financial" in name or "finance" in name:
-            return {
-                "description": "FinSolve's quarterly financial performance for the year 2024",
-                "purpose": "Documents quarterly financial performance including revenue, income, gross margin, marketing spend, vendor costs, and cash flow data",
-                "ownership": "Finance Team",
-                "update_frequency": "Updated quarterly",
-                "sensitivity_level": "High - restricted to Finance Team and C-Level Executives",
-                "usage_context": ["financial planning", "audits", "investor reporting", "strategic decisions"],
-                "content_summary": "Provides detailed expense breakdowns and risk mitigation strategies for each quarter",
-                "key_topics": ["revenue", "income", "gross margin", "marketing spend", "vendor costs", "cash flow", "expenses", "risk mitigation"]
-            }
-
-        # Employee Handbook
-        elif "handbook" in name or "employee" in name:
-            return {
-                "description": "Comprehensive company policies covering all aspects of employment",
-                "purpose": "Serves as the authoritative guide for employees on company vision, values, HR processes, legal compliance, and workplace standards",
-                "ownership": "Human Resources Department",
-                "update_frequency": "Reviewed and updated annually or as regulations and company practices change",
-                "sensitivity_level": "Medium - accessible to all employees",
-                "usage_context": ["new-hire orientation", "policy clarifications", "leave & attendance management", "performance reviews", "exit procedures"],
-                "content_summary": "Covers onboarding & benefits, leave policies, work hours & attendance, code of conduct & workplace behavior, health & safety, compensation & payroll, reimbursement, training & development, performance & feedback, privacy & data security, exit procedures, FAQs",
-                "key_topics": ["onboarding", "benefits", "leave policies", "attendance", "code of conduct", "health & safety", "compensation", "payroll", "training", "performance", "privacy", "data security"]
-            }
-
-        # HR Data
-        elif department == Department.HR or "hr" in name:
-            return {
-                "description": "HR's employee dataset covering 100 records with comprehensive employee information",
-                "purpose": "Documents HR's employee dataset with demographics, employment, compensation, leave, attendance, and performance fields",
-                "ownership": "HR & People Analytics team",
-                "update_frequency": "Refreshed monthly to capture hires, exits, and updates",
-                "sensitivity_level": "High - restricted to HR and C-Level Executives",
-                "usage_context": ["talent forecasting", "compensation reviews", "compliance reporting", "employee engagement initiatives"],
-                "content_summary": "Provides workforce composition insights, turnover tracking, leave utilization, and performance trend analysis",
-                "key_topics": ["demographics", "employment", "compensation", "leave", "attendance", "performance", "workforce composition", "turnover", "engagement"]
-            }
-
-        # Marketing Department
-        elif department == Department.MARKETING or "marketing" in name or "campaign" in name:
-            return {
-                "description": "Marketing department data including campaign overviews and performance metrics",
-                "purpose": "Includes campaign overviews, spend allocations, customer acquisition targets, revenue projections, conversion and ROI benchmarks",
-                "ownership": "Marketing Team",
-                "update_frequency": "Refreshed quarterly",
-                "sensitivity_level": "Medium - restricted to Marketing Team and C-Level Executives",
-                "usage_context": ["quarterly planning", "budget allocation", "performance reviews", "Q1 2025 strategy recommendations"],
-                "content_summary": "Provides detailed highlights on digital marketing, B2B initiatives, customer retention programs, and preliminary performance analysis",
-                "key_topics": ["campaigns", "spend allocation", "customer acquisition", "revenue projections", "conversion", "ROI", "digital marketing", "B2B", "customer retention"]
-            }
-
-        # Default/General
-        else:
-            return {
-                "description": f"Data file: {file_path.name}",
-                "purpose": "General company data and documentation",
-                "ownership": "Various departments",
-                "update_frequency": "As needed",
-                "sensitivity_level": "Medium",
-                "usage_context": ["general reference", "documentation"],
-                "content_summary": f"Content from {file_path.name}",
-                "key_topics": ["general", "documentation"]
-            }
+        
+        for template_department, pattern, template in _METADATA_DISPATCH:
+            if department == template_department or pattern.search(name):
+                return template
+        
+        # Default/General: shared template with per-file description
+        return {
+            **_GENERAL_METADATA,
+            "description": f"Data file: {file_path.name}",
+            "content_summary": f"Content from {file_path.name}"
+        }
     
     def check_access_permission(self, user_role: UserRole, data_source_key: str) -> bool:
         """Check if user role has permission to access data source"""
@@ -318,18 +481,15 @@ class DataProcessor:
             
             source = self.data_sources[file_key]
             
-            # Load CSV data
-            df = pd.read_csv(source.path)
-            
-            # Apply role-based filtering
-            df = self._apply_role_based_filtering(df, user_role, source.department)
+            # Role-filtered view of the cached frame
+            df = self._role_view(source, user_role)
             
             # Apply query parameters
             if query_params:
                 df = self._apply_query_filters(df, query_params)
             
             # Convert to appropriate format
-            result_data = df.to_dict('records') if len(df) <= 1000 else df.head(1000).to_dict('records')
+            result_data = df.head(CSV_ROW_LIMIT).to_dict('records')
             
             processing_time = (datetime.now() - start_time).total_seconds()
             
@@ -341,7 +501,7 @@ class DataProcessor:
                     "columns": list(df.columns),
                     "data_type": "csv",
                     "department": source.department.value,
-                    "truncated": len(df) > 1000
+                    "truncated": len(df) > CSV_ROW_LIMIT
                 },
                 source_files=[source.path],
                 processing_time=processing_time
@@ -376,7 +536,7 @@ class DataProcessor:
             if field in df.columns:
                 if user_role == UserRole.HR and field == "salary":
                     # HR can see salary ranges but not exact values
-                    df[field] = df[field].apply(lambda x: self._mask_salary(x))
+                    df[field] = self._mask_salary(df[field])
                 else:
                     # Remove the column entirely
                     df = df.drop(columns=[field])
@@ -384,44 +544,105 @@ class DataProcessor:
         # Apply department-specific filtering
         if department == Department.HR and user_role != UserRole.HR and user_role != UserRole.CEO:
             # Non-HR users can only see basic employee info
-            allowed_columns = ["employee_id", "full_name", "role", "department", "email"]
-            df = df[[col for col in allowed_columns if col in df.columns]]
+            df = df[[col for col in HR_BASIC_COLUMNS if col in df.columns]]
         
         return df
     
-    def _mask_salary(self, salary: Union[int, float]) -> str:
+    def _role_view(self, source: DataSource, user_role: UserRole) -> pd.DataFrame:
+        """Get the projected, role-filtered frame for a CSV source, built once per parsed frame"""
+        df, role_views = self._load_csv(source.path)
+        view = role_views.get(user_role)
+        if view is None:
+            # Project the cached frame onto the columns the role can see
+            visible = self._visible_csv_columns(user_role, source.department)
+            view = df[[col for col in df.columns if visible(col)]]
+            view = self._apply_role_based_filtering(view, user_role, source.department)
+            role_views[user_role] = view
+        return view
+    
+    def _parse_csv(self, path: str) -> pd.DataFrame:
+        """Parse a CSV with the preferred engine, then apply its categorical schema hints"""
+        df = None
+        if CSV_ENGINE == "pyarrow":
+            try:
+                df = pd.read_csv(path, engine="pyarrow")
+                
+                # pyarrow infers dates/times that the C parser leaves as text; re-read those verbatim
+                temporal = [
+                    col for col in df.columns
+                    if pd.api.types.infer_dtype(df[col], skipna=True) in ARROW_TEMPORAL_KINDS
+                ]
+                if temporal:
+                    df[temporal] = pd.read_csv(path, engine="pyarrow", usecols=temporal, dtype=str)
+            except Exception as e:
+                logger.warning(f"pyarrow CSV parse failed for {path}, using C engine: {str(e)}")
+                df = None
+            
+            # In debug runs, verify the pyarrow frame matches what the C parser returns
+            if df is not None and settings.debug:
+                reference = pd.read_csv(path)
+                if not df.equals(reference):
+                    logger.warning(f"pyarrow and C CSV parsers disagree for {path}, using C engine")
+                    df = reference
+        if df is None:
+            df = pd.read_csv(path)
+        
+        hints = CSV_SCHEMA_HINTS.get(os.path.basename(path), {})
+        return df.astype({col: dtype for col, dtype in hints.items() if col in df.columns})
+    
+    def _load_csv(self, path: str) -> Tuple[pd.DataFrame, Dict[UserRole, pd.DataFrame]]:
+        """Return the parsed CSV and its role views from the LRU frame cache, keyed by path, mtime and size"""
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        with self._csv_cache_lock:
+            entry = self._csv_cache.get(key)
+            if entry is not None:
+                self._csv_cache.move_to_end(key)
+                return entry
+        
+        df = self._parse_csv(path)
+        with self._csv_cache_lock:
+            # Drop frames parsed from earlier versions of the same file
+            for stale in [k for k in self._csv_cache if k[0] == path]:
+                del self._csv_cache[stale]
+            entry = self._csv_cache[key] = (df, {})
+            while len(self._csv_cache) > CSV_CACHE_MAXSIZE:
+                self._csv_cache.popitem(last=False)
+        return entry
+    
+    def _visible_csv_columns(self, user_role: UserRole, department: Department) -> Callable[[str], bool]:
+        """Build a read_csv usecols predicate that skips columns the role cannot see"""
+        dropped = {
+            field for field in ROLE_PERMISSIONS.get_restricted_fields(user_role)
+            if not (user_role == UserRole.HR and field == "salary")
+        }
+        if department == Department.HR and user_role != UserRole.HR and user_role != UserRole.CEO:
+            return lambda column: column in HR_BASIC_COLUMNS and column not in dropped
+        return lambda column: column not in dropped
+    
+    def _mask_salary(self, salary: pd.Series) -> pd.Series:
         """Mask salary values to show ranges instead of exact amounts"""
-        if pd.isna(salary):
-            return "Not specified"
-        
-        salary = float(salary)
-        if salary < 500000:
-            return "Below 5L"
-        elif salary < 1000000:
-            return "5L - 10L"
-        elif salary < 1500000:
-            return "10L - 15L"
-        elif salary < 2000000:
-            return "15L - 20L"
-        else:
-            return "Above 20L"
+        bands = pd.cut(salary.astype(float), bins=SALARY_BINS, labels=SALARY_LABELS, right=False)
+        return bands.astype(object).where(salary.notna(), "Not specified")
     
     def _apply_query_filters(self, df: pd.DataFrame, query_params: Dict[str, Any]) -> pd.DataFrame:
         """Apply query filters to dataframe"""
         
+        # Combine every filter into one mask so the frame is sliced once
+        mask = np.ones(len(df), dtype=bool)
         for key, value in query_params.items():
             if key in df.columns:
                 if isinstance(value, str):
-                    # String filtering (case-insensitive contains)
-                    df = df[df[key].astype(str).str.contains(value, case=False, na=False)]
+                    # String filtering (case-insensitive literal contains)
+                    mask &= df[key].astype(str).str.contains(value, case=False, na=False, regex=False).to_numpy()
                 elif isinstance(value, (int, float)):
                     # Numeric filtering (exact match)
-                    df = df[df[key] == value]
+                    mask &= (df[key] == value).to_numpy()
                 elif isinstance(value, list):
                     # List filtering (isin)
-                    df = df[df[key].isin(value)]
+                    mask &= df[key].isin(value).to_numpy()
         
-        return df
+        return df.loc[mask]
     
     def search_text_content(
         self,
@@ -449,14 +670,30 @@ class DataProcessor:
                     if s.department.value == department_filter.lower()
                 ]
             
-            # Search through text-based files
+            # Search through text-based files, skipping those the index rules out
+            query_tokens = _TOKEN_RE.findall(search_query.lower())
+            
+            # Compile once per query; bytes patterns scan the mmaps directly but only fold ASCII case
+            if search_query.isascii():
+                query_pattern = re.compile(re.escape(search_query.encode()), re.IGNORECASE)
+            else:
+                query_pattern = re.compile(re.escape(search_query), re.IGNORECASE)
+            indexed = False
             for source in accessible_sources:
                 if source.data_type in [DataType.MARKDOWN, DataType.TEXT]:
-                    matches = self._search_in_file(source.path, search_query)
+                    postings, built = self._get_text_index(source)
+                    indexed |= built
+                    candidate_lines = self._candidate_lines(postings, query_tokens)
+                    if candidate_lines is not None and not candidate_lines:
+                        continue
+                    matches = self._search_in_file(source.path, query_pattern, search_query)
                     if matches:
                         results.extend(matches)
                         source_files.append(source.path)
             
+            if indexed:
+                self._save_text_index()
+            
             processing_time = (datetime.now() - start_time).total_seconds()
             
             return QueryResult(
@@ -485,32 +722,115 @@ class DataProcessor:
                 error=str(e)
             )
     
-    def _search_in_file(self, file_path: str, search_query: str) -> List[Dict[str, Any]]:
-        """Search for query in a specific file"""
+    def _get_text_index(self, source: DataSource) -> Tuple[Dict[str, List[int]], bool]:
+        """Get the token -> line numbers index for a text source, rebuilding it if the file changed"""
+        try:
+            stat = os.stat(source.path)
+        except OSError as e:
+            logger.warning(f"Failed to stat file {source.path}: {str(e)}")
+            return {}, False
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._text_index_lock:
+            entry = self._text_index.get(source.path)
+        if entry is not None and entry[0] == version:
+            return entry[1], False
+        
+        postings: Dict[str, List[int]] = {}
+        content = self._read_text(source.path)
+        for line_num, line in enumerate(content.lower().split('\n'), 1):
+            for token in set(_TOKEN_RE.findall(line)):
+                postings.setdefault(token, []).append(line_num)
+        
+        with self._text_index_lock:
+            self._text_index[source.path] = (version, postings)
+        return postings, True
+    
+    def _save_text_index(self) -> None:
+        """Persist text indexes for cataloged sources, dropping removed files"""
+        with self._text_index_lock:
+            paths = {source.path for source in self.data_sources.values()}
+            self._text_index = {
+                path: entry for path, entry in self._text_index.items() if path in paths
+            }
+            self._save_cache(TEXT_INDEX_CACHE_KEY, self._text_index)
+    
+    def _candidate_lines(self, postings: Dict[str, List[int]], query_tokens: List[str]) -> Optional[set]:
+        """Line numbers that may contain the query per the index; None means scan every line"""
+        if not query_tokens:
+            return None
+        
+        # Inner query tokens are whole words; the outer ones may be cut mid-word
+        last = len(query_tokens) - 1
+        lines = None
+        for i, query_token in enumerate(query_tokens):
+            if last == 0:
+                keys = [token for token in postings if query_token in token]
+            elif i == 0:
+                keys = [token for token in postings if token.endswith(query_token)]
+            elif i == last:
+                keys = [token for token in postings if token.startswith(query_token)]
+            else:
+                keys = [query_token] if query_token in postings else []
+            
+            found = set()
+            for key in keys:
+                found.update(postings[key])
+            lines = found if lines is None else lines & found
+            if not lines:
+                break
+        return lines
+    
+    def _search_in_file(
+        self,
+        file_path: str,
+        query_pattern: re.Pattern,
+        search_query: str
+    ) -> List[Dict[str, Any]]:
+        """Search for a compiled query in a specific file, decoding only matched lines and their context"""
         matches = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-                lines = content.split('\n')
+            mapped_file = self._get_mapped_file(file_path)
+            if mapped_file is None:
+                return matches
+            
+            if isinstance(query_pattern.pattern, bytes):
+                content, newlines = mapped_file
+                decode = lambda raw: raw.decode("utf-8").replace("\r\n", "\n").removesuffix("\r")
+            else:
+                content = self._read_text(file_path)
+                newlines = np.fromiter((m.start() for m in _NEWLINE_RE.finditer(content)), dtype=np.int64)
+                decode = lambda raw: raw
+            
+            size, line_count = len(content), len(newlines)
+            match = query_pattern.search(content)
+            while match:
+                # Map the match offset to its line through the sorted newline offsets
+                line_index = int(np.searchsorted(newlines, match.start()))
+                line_start = int(newlines[line_index - 1]) + 1 if line_index > 0 else 0
+                line_end = int(newlines[line_index]) if line_index < line_count else size
                 
-                # Search for query (case-insensitive)
-                query_pattern = re.compile(re.escape(search_query), re.IGNORECASE)
+                # One result per line; matches never span lines
+                next_match = query_pattern.search(content, line_end + 1) if line_end < size else None
+                if match.end() > line_end:
+                    match = next_match
+                    continue
+                
+                line = decode(content[line_start:line_end])
+                
+                # Get context (two lines either side)
+                context_start = int(newlines[line_index - 3]) + 1 if line_index >= 3 else 0
+                context_end = int(newlines[line_index + 2]) if line_index + 2 < line_count else size
+                context = decode(content[context_start:context_end])
                 
-                for line_num, line in enumerate(lines, 1):
-                    if query_pattern.search(line):
-                        # Get context (surrounding lines)
-                        start_line = max(0, line_num - 3)
-                        end_line = min(len(lines), line_num + 2)
-                        context = '\n'.join(lines[start_line:end_line])
-                        
-                        matches.append({
-                            "file": file_path,
-                            "line_number": line_num,
-                            "matched_line": line.strip(),
-                            "context": context,
-                            "relevance_score": self._calculate_relevance(line, search_query)
-                        })
+                matches.append({
+                    "file": file_path,
+                    "line_number": line_index + 1,
+                    "matched_line": line.strip(),
+                    "context": context,
+                    "relevance_score": self._calculate_relevance(line, search_query)
+                })
+                match = next_match
         
         except Exception as e:
             logger.warning(f"Failed to search in file {file_path}: {str(e)}")
@@ -543,7 +863,19 @@ class DataProcessor:
         return matches / len(query_words) if query_words else 0
     
     def get_data_summary(self, user_role: UserRole) -> Dict[str, Any]:
-        """Get summary of available data for user role"""
+        """Get summary of available data for user role (cached for 30s)"""
+        with self._summary_lock:
+            summary = self._summary_cache.get(user_role)
+        if summary is not None:
+            return summary
+        
+        summary = self._build_data_summary(user_role)
+        with self._summary_lock:
+            self._summary_cache[user_role] = summary
+        return summary
+    
+    def _build_data_summary(self, user_role: UserRole) -> Dict[str, Any]:
+        """Build summary of available data for user role"""
         accessible_sources = self.get_available_data_sources(user_role)
         
         summary = {
@@ -569,13 +901,62 @@ class DataProcessor:
         
         return summary
 
-    @lru_cache(maxsize=128)
-    def _get_cached_file_content(self, file_path: str, file_hash: str) -> str:
-        """Get cached file content using LRU cache"""
+    def _get_mapped_file(self, file_path: str) -> Optional[Tuple[mmap.mmap, np.ndarray]]:
+        """Get a read-only mapping of a file and its newline offsets from the LRU mmap cache, keyed by path, mtime and size"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except Exception as e:
+            stat = os.stat(file_path)
+        except OSError as e:
+            logger.warning(f"Failed to stat file {file_path}: {str(e)}")
+            return None
+        key = (file_path, stat.st_mtime_ns, stat.st_size)
+        with self._mmap_cache_lock:
+            mapped_file = self._mmap_cache.get(key)
+            if mapped_file is not None:
+                self._mmap_cache.move_to_end(key)
+                self._mmap_hits += 1
+                return mapped_file
+            self._mmap_misses += 1
+            
+            # Drop mappings of earlier versions of the same file
+            for stale in [k for k in self._mmap_cache if k[0] == file_path]:
+                self._close_mmap(self._mmap_cache.pop(stale)[0])
+        
+        # Empty files cannot be mapped and have nothing to search
+        if stat.st_size == 0:
+            return None
+        
+        try:
+            with open(file_path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to map file {file_path}: {str(e)}")
+            return None
+        
+        # Sorted byte offsets of every newline, for offset -> line lookups
+        newlines = np.flatnonzero(np.frombuffer(mapped, dtype=np.uint8) == ord("\n"))
+        
+        mapped_file = (mapped, newlines)
+        with self._mmap_cache_lock:
+            self._mmap_cache[key] = mapped_file
+            while len(self._mmap_cache) > MMAP_CACHE_MAXSIZE:
+                self._close_mmap(self._mmap_cache.popitem(last=False)[1][0])
+        return mapped_file
+
+    def _close_mmap(self, mapped: mmap.mmap) -> None:
+        """Close an evicted mapping unless a search still holds a view of it"""
+        try:
+            mapped.close()
+        except BufferError:
+            pass
+
+    def _read_text(self, file_path: str) -> str:
+        """Decode a whole mapped file, for indexing and non-ASCII searches"""
+        mapped_file = self._get_mapped_file(file_path)
+        if mapped_file is None:
+            return ""
+        try:
+            return mapped_file[0][:].decode('utf-8').replace('\r\n', '\n')
+        except (UnicodeDecodeError, ValueError) as e:
             logger.warning(f"Failed to read file {file_path}: {str(e)}")
             return ""
 
@@ -604,7 +985,14 @@ class DataProcessor:
         try:
             for cache_file in self.cache_directory.glob("*.pkl"):
                 cache_file.unlink()
-            self._get_cached_file_content.cache_clear()
+            with self._mmap_cache_lock:
+                for mapped, _ in self._mmap_cache.values():
+                    self._close_mmap(mapped)
+                self._mmap_cache.clear()
+            with self._summary_lock:
+                self._summary_cache.clear()
+            with self._csv_cache_lock:
+                self._csv_cache.clear()
             logger.info("Cache cleared successfully")
         except Exception as e:
             logger.error(f"Failed to clear cache: {str(e)}")
@@ -612,9 +1000,10 @@ class DataProcessor:
     def get_memory_usage(self) -> Dict[str, Any]:
         """Get memory usage statistics"""
         stats = {
-            "cache_hits": self._get_cached_file_content.cache_info().hits,
-            "cache_misses": self._get_cached_file_content.cache_info().misses,
-            "cache_size": self._get_cached_file_content.cache_info().currsize,
+            "cache_hits": self._mmap_hits,
+            "cache_misses": self._mmap_misses,
+            "cache_size": len(self._mmap_cache),
+            "csv_cache_size": len(self._csv_cache),
             "data_sources_count": len(self.data_sources),
             "python_objects": len(gc.get_objects())
         }
@@ -8,11 +8,12 @@ Version: 1.0.0
 """
 
 from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 from contextlib import contextmanager
-from typing import Generator, Optional
+from typing import AsyncGenerator, Generator, Optional
 import time
 from loguru import logger
 
@@ -29,7 +30,10 @@ class DatabaseManager:
         self.database_url = settings.database_url
         self.engine = None
         self.SessionLocal = None
+        self.async_engine = None
+        self.AsyncSessionLocal = None
         self._initialize_engine()
+        self._initialize_async_engine()
         
     def _initialize_engine(self):
         """Initialize database engine with appropriate configuration"""
@@ -60,9 +64,12 @@ class DatabaseManager:
             )
         
         # Create session factory
+        # expire_on_commit=False keeps RETURNING-populated objects usable
+        # after commit without a reload SELECT
         self.SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
+            expire_on_commit=False,
             bind=self.engine
         )
         
@@ -71,23 +78,70 @@ class DatabaseManager:
         
         logger.info(f"Database engine initialized: {self.database_url}")
     
+    def _initialize_async_engine(self):
+        """Initialize the async engine used by non-blocking request handlers"""
+        async_url = self._get_async_database_url()
+        
+        if async_url.startswith("sqlite"):
+            self.async_engine = create_async_engine(
+                async_url,
+                connect_args={"timeout": 20},
+                echo=settings.debug
+            )
+        else:
+            self.async_engine = create_async_engine(
+                async_url,
+                pool_size=20,
+                max_overflow=10,
+                pool_pre_ping=True,
+                pool_recycle=3600,
+                echo=settings.debug
+            )
+        
+        self.AsyncSessionLocal = async_sessionmaker(
+            self.async_engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False
+        )
+        
+        # Apply the same connection pragmas as the sync engine
+        event.listen(self.async_engine.sync_engine, "connect", self._set_sqlite_pragma)
+        
+        logger.info(f"Async database engine initialized: {async_url}")
+    
+    def _get_async_database_url(self) -> str:
+        """Map the configured database URL onto its async driver"""
+        url = self.database_url
+        
+        if url.startswith("sqlite:"):
+            return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+        if url.startswith("postgresql+psycopg2:"):
+            return url.replace("postgresql+psycopg2:", "postgresql+asyncpg:", 1)
+        if url.startswith("postgresql:"):
+            return url.replace("postgresql:", "postgresql+asyncpg:", 1)
+        if url.startswith("postgres:"):
+            return url.replace("postgres:", "postgresql+asyncpg:", 1)
+        return url
+    
+    def _set_sqlite_pragma(self, dbapi_connection, connection_record):
+        """Set SQLite pragmas for better performance and reliability"""
+        if self.database_url.startswith("sqlite"):
+            cursor = dbapi_connection.cursor()
+            # Enable foreign key constraints
+            cursor.execute("PRAGMA foreign_keys=ON")
+            # Set journal mode to WAL for better concurrency
+            cursor.execute("PRAGMA journal_mode=WAL")
+            # Set synchronous mode to NORMAL for better performance
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            # Set cache size (negative value means KB)
+            cursor.execute("PRAGMA cache_size=-64000")  # 64MB cache
+            cursor.close()
+    
     def _setup_event_listeners(self):
         """Setup database event listeners for monitoring and optimization"""
         
-        @event.listens_for(self.engine, "connect")
-        def set_sqlite_pragma(dbapi_connection, connection_record):
-            """Set SQLite pragmas for better performance and reliability"""
-            if self.database_url.startswith("sqlite"):
-                cursor = dbapi_connection.cursor()
-                # Enable foreign key constraints
-                cursor.execute("PRAGMA foreign_keys=ON")
-                # Set journal mode to WAL for better concurrency
-                cursor.execute("PRAGMA journal_mode=WAL")
-                # Set synchronous mode to NORMAL for better performance
-                cursor.execute("PRAGMA synchronous=NORMAL")
-                # Set cache size (negative value means KB)
-                cursor.execute("PRAGMA cache_size=-64000")  # 64MB cache
-                cursor.close()
+        event.listen(self.engine, "connect", self._set_sqlite_pragma)
         
         @event.listens_for(self.engine, "before_cursor_execute")
         def receive_before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
@@ -171,6 +225,12 @@ class DatabaseManager:
         if self.engine:
             self.engine.dispose()
             logger.info("Database connections closed")
+    
+    async def close_async(self):
+        """Close async database connections"""
+        if self.async_engine:
+            await self.async_engine.dispose()
+            logger.info("Async database connections closed")
 
 
 # Global database manager instance
@@ -192,12 +252,28 @@ def get_db() -> Generator[Session, None, None]:
         session.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function for FastAPI to get a non-blocking database session
+    """
+    async with db_manager.AsyncSessionLocal() as session:
+        try:
+            yield session
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Database session error in dependency: {str(e)}")
+            raise
+
+
 def init_database():
     """Initialize database with tables and default data"""
     try:
         # Create tables
         db_manager.create_tables()
         
+        # Convert legacy enum-name roles to SMALLINT codes
+        migrate_role_storage()
+        
         # Create default users if they don't exist
         create_default_users()
         
@@ -208,6 +284,47 @@ def init_database():
         raise
 
 
+def migrate_role_storage():
+    """Convert users.role from enum-name storage to RoleType SMALLINT codes (idempotent)"""
+    from sqlalchemy import inspect
+    from sqlalchemy.types import Integer
+    from ..auth.models import _ROLE_CODES
+    
+    inspector = inspect(db_manager.engine)
+    if not inspector.has_table("users"):
+        return
+    role_column = next(col for col in inspector.get_columns("users") if col["name"] == "role")
+    if isinstance(role_column["type"], Integer):
+        return
+    
+    # Legacy rows hold the enum name (SQLEnum default); accept values too
+    cases = " ".join(
+        f"WHEN '{label}' THEN {code}"
+        for role, code in _ROLE_CODES.items()
+        for label in (role.name, role.value)
+    )
+    legacy_labels = ", ".join(
+        f"'{label}'" for role in _ROLE_CODES for label in (role.name, role.value)
+    )
+    
+    with db_manager.engine.begin() as conn:
+        if db_manager.engine.dialect.name == "postgresql":
+            conn.execute(text(
+                f"ALTER TABLE users ALTER COLUMN role TYPE SMALLINT "
+                f"USING (CASE role::text {cases} END)"
+            ))
+            conn.execute(text("DROP TYPE IF EXISTS userrole"))
+            logger.info("Migrated users.role to SMALLINT role codes")
+        else:
+            # SQLite cannot change a column type in place; codes stored in the
+            # text-affinity column still compare equal to bound integers
+            result = conn.execute(text(
+                f"UPDATE users SET role = CASE role {cases} END WHERE role IN ({legacy_labels})"
+            ))
+            if result.rowcount:
+                logger.info(f"Migrated {result.rowcount} users.role values to role codes")
+
+
 def create_default_users():
     """Create default users for testing and demonstration"""
     from ..auth.service import auth_service
@@ -342,6 +459,7 @@ def create_default_users():
 __all__ = [
     "db_manager",
     "get_db",
+    "get_async_db",
     "init_database",
     "create_default_users"
 ]
@@ -9,6 +9,10 @@ Version: 1.0.0
 
 import os
 import hashlib
+import threading
+import time
+from collections import OrderedDict
+from cachetools import TTLCache
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import chromadb
@@ -179,6 +183,89 @@ class DocumentChunker:
         return sections
 
 
+class SearchResultCache:
+    """
+    Role-aware semantic cache for search results
+
+    Query embeddings are bucketed with random-hyperplane LSH; a lookup only
+    hits when a cached query in the same (role, department, limit, bucket)
+    slot is within ``similarity_threshold`` cosine similarity.
+    """
+    
+    def __init__(
+        self,
+        num_planes: int = 16,
+        similarity_threshold: float = 0.95,
+        ttl_seconds: float = 600.0,
+        max_entries: int = 1024,
+        seed: int = 42
+    ):
+        self.num_planes = num_planes
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._rng = np.random.default_rng(seed)
+        self._planes: Optional[np.ndarray] = None
+        self._entries: "OrderedDict[Tuple, List[Tuple[np.ndarray, float, List[SearchResult]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _bucket(self, embedding: np.ndarray) -> int:
+        """Hash an embedding to its LSH bucket"""
+        if self._planes is None or self._planes.shape[1] != embedding.shape[0]:
+            self._planes = self._rng.standard_normal((self.num_planes, embedding.shape[0]))
+            self._entries.clear()
+        
+        bits = (self._planes @ embedding) > 0
+        return int(bits @ (1 << np.arange(self.num_planes)))
+    
+    def _key(self, user_role: UserRole, department_filter: Optional[str], n_results: int, embedding: np.ndarray) -> Tuple:
+        return (user_role.value, (department_filter or "*").lower(), n_results, self._bucket(embedding))
+    
+    def get(
+        self,
+        user_role: UserRole,
+        department_filter: Optional[str],
+        n_results: int,
+        embedding: np.ndarray
+    ) -> Optional[List[SearchResult]]:
+        """Get cached results for a near-duplicate query, if any"""
+        now = time.monotonic()
+        with self._lock:
+            key = self._key(user_role, department_filter, n_results, embedding)
+            entries = self._entries.get(key)
+            if not entries:
+                return None
+            
+            entries[:] = [entry for entry in entries if entry[1] > now]
+            for cached_embedding, _, results in entries:
+                if float(cached_embedding @ embedding) >= self.similarity_threshold:
+                    self._entries.move_to_end(key)
+                    return results
+            return None
+    
+    def put(
+        self,
+        user_role: UserRole,
+        department_filter: Optional[str],
+        n_results: int,
+        embedding: np.ndarray,
+        results: List[SearchResult]
+    ):
+        """Cache results for a query embedding"""
+        with self._lock:
+            key = self._key(user_role, department_filter, n_results, embedding)
+            self._entries.setdefault(key, []).append((embedding, time.monotonic() + self.ttl_seconds, results))
+            self._entries.move_to_end(key)
+            
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached results (e.g. after the collection changes)"""
+        with self._lock:
+            self._entries.clear()
+
+
 class VectorStore:
     """
     Production-grade vector store with ChromaDB backend
@@ -201,6 +288,13 @@ class VectorStore:
             chunk_overlap=settings.chunk_overlap
         )
         
+        # Semantic cache for direct document searches
+        self.search_cache = SearchResultCache()
+        
+        # Short-lived cache for collection stats (health probes, data summary)
+        self._stats_cache: TTLCache = TTLCache(maxsize=1, ttl=30)
+        self._stats_lock = threading.Lock()
+        
         logger.info("Vector store initialized successfully")
     
     def _initialize_chroma(self):
@@ -325,6 +419,9 @@ class VectorStore:
                 metadatas=metadatas
             )
             
+            self.search_cache.clear()
+            self._invalidate_stats_cache()
+            
             logger.info(f"Added {len(documents)} documents to vector store")
             return True
             
@@ -337,12 +434,14 @@ class VectorStore:
         query: str,
         user_role: UserRole,
         n_results: int = 5,
-        department_filter: Optional[str] = None
+        department_filter: Optional[str] = None,
+        query_embedding: Optional[List[float]] = None
     ) -> List[SearchResult]:
         """Search for similar documents with role-based filtering"""
         try:
             # Generate query embedding
-            query_embedding = self.generate_embeddings([query])[0]
+            if query_embedding is None:
+                query_embedding = self.generate_embeddings([query])[0]
             
             # Build where clause for role-based filtering
             where_clause = self._build_where_clause(user_role, department_filter)
@@ -388,6 +487,41 @@ class VectorStore:
             logger.error(f"Search failed: {str(e)}")
             return []
     
+    def cached_search(
+        self,
+        query: str,
+        user_role: UserRole,
+        n_results: int = 5,
+        department_filter: Optional[str] = None
+    ) -> List[SearchResult]:
+        """Search, reusing results of a recent near-identical query for the same role"""
+        try:
+            query_embedding = self.generate_embeddings([query])[0]
+        except Exception as e:
+            logger.error(f"Search failed: {str(e)}")
+            return []
+        
+        embedding = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(embedding)
+        if norm > 0:
+            embedding = embedding / norm
+        
+        cached = self.search_cache.get(user_role, department_filter, n_results, embedding)
+        if cached is not None:
+            return cached
+        
+        results = self.search(
+            query=query,
+            user_role=user_role,
+            n_results=n_results,
+            department_filter=department_filter,
+            query_embedding=query_embedding
+        )
+        if results:
+            self.search_cache.put(user_role, department_filter, n_results, embedding, results)
+        
+        return results
+    
     def _build_where_clause(self, user_role: UserRole, department_filter: Optional[str]) -> Dict[str, Any]:
         """Build where clause for ChromaDB query based on user role"""
         where_clause = {}
@@ -550,7 +684,25 @@ class VectorStore:
             return []
     
     def get_collection_stats(self) -> Dict[str, Any]:
-        """Get statistics about the vector store collection"""
+        """Get statistics about the vector store collection (cached for 30s)"""
+        with self._stats_lock:
+            stats = self._stats_cache.get("stats")
+        if stats is not None:
+            return stats
+        
+        stats = self._compute_collection_stats()
+        if stats:
+            with self._stats_lock:
+                self._stats_cache["stats"] = stats
+        return stats
+    
+    def _invalidate_stats_cache(self):
+        """Drop cached collection stats after the collection changes"""
+        with self._stats_lock:
+            self._stats_cache.clear()
+    
+    def _compute_collection_stats(self) -> Dict[str, Any]:
+        """Compute statistics about the vector store collection"""
         try:
             count = self.collection.count()
             
@@ -587,6 +739,8 @@ class VectorStore:
                 name=self.collection_name,
                 metadata={"description": "FinSolve RBAC Chatbot document collection"}
             )
+            self.search_cache.clear()
+            self._invalidate_stats_cache()
             logger.warning("Vector store collection reset")
             return True
         except Exception as e: